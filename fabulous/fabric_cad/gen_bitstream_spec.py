@@ -5,12 +5,12 @@ definitions. The specification defines how configuration bits map to physical fr
 locations and is used during bitstream generation.
 """
 
-import string
 from importlib.metadata import version
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from fabulous.fabric_definition.define import BEL_LETTERS
 from fabulous.fabric_definition.fabric import Fabric
 from fabulous.fabric_generator.parser.parse_configmem import parseConfigMem
 from fabulous.fabulous_settings import get_context
@@ -162,12 +162,12 @@ def generateBitstreamSpec(fabric: Fabric) -> dict[str, dict]:
                 for featureKey, keyDict in bel.belFeatureMap.items():
                     for entry in (k for k in keyDict if isinstance(k, int)):
                         for v in keyDict[entry]:
-                            curTileMap[f"{string.ascii_uppercase[i]}.{featureKey}"] = {
+                            curTileMap[f"{BEL_LETTERS[i]}.{featureKey}"] = {
+                                encodeDict[curBitOffset + v]: keyDict[entry][v]
+                            }
+                            curTileMapNoMask[f"{BEL_LETTERS[i]}.{featureKey}"] = {
                                 encodeDict[curBitOffset + v]: keyDict[entry][v]
                             }
-                            curTileMapNoMask[
-                                f"{string.ascii_uppercase[i]}.{featureKey}"
-                            ] = {encodeDict[curBitOffset + v]: keyDict[entry][v]}
                         curBitOffset += len(keyDict[entry])
 
             result = tile.switch_matrix.connections
@@ -280,7 +280,7 @@ def generateBitstreamSpec(fabric: Fabric) -> dict[str, dict]:
             bel_coord = (ftx, fty)
             bel_offset = len(master_tile.bels) + st_bel_count.get(bel_coord, 0)
             for i, bel in enumerate(super_tile.bels):
-                letter = string.ascii_uppercase[bel_offset + i]
+                letter = BEL_LETTERS[bel_offset + i]
                 for featureKey, keyDict in bel.belFeatureMap.items():
                     for entry in keyDict:
                         if not isinstance(entry, int):
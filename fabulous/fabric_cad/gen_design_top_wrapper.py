@@ -10,6 +10,7 @@ from pathlib import Path
 from loguru import logger
 
 from fabulous.custom_exception import InvalidFileType
+from fabulous.fabric_definition.define import BEL_LETTERS
 from fabulous.fabric_definition.fabric import Fabric
 from fabulous.fabric_generator.parser.parse_hdl import parseBelFile
 
@@ -120,10 +121,10 @@ def generateUserDesignTopWrapper(
 
                 # This is done similar in the npnr model gen, to get the bel prefix
                 # So we assume to get the same Bel prefix here.
-                # convert number of bel i to character A,B,C ...
+                # convert number of bel i to character A,B,C ... Z, AA, AB ...
                 # But we need to do this backwards, starting with the highest letter for
                 # a tile
-                prefix = chr(ord("A") + len(bels) - 1 - i)
+                prefix = BEL_LETTERS[len(bels) - 1 - i]
 
                 if bel.name in [
                     "InPass4_frame_config",
@@ -9,14 +9,17 @@ The generated models enable nextpnr to understand the fabric architecture and pe
 placement and routing for user designs.
 """
 
-import string
+import io
+from functools import cache
 from pathlib import Path
+from typing import TextIO
 
 from fabulous.custom_exception import InvalidState
 from fabulous.fabric_cad.timing_model.FABulous_timing_model_interface import (
     FABulousTimingModelInterface,
 )
 from fabulous.fabric_definition.bel import Bel
+from fabulous.fabric_definition.define import BEL_LETTERS
 from fabulous.fabric_definition.fabric import Fabric
 
 # Dummy BEL timing values (ns), mirroring nextpnr's historical hardcoded
@@ -104,8 +107,28 @@ IO_BEL_TYPES = (
 )
 
 
+def _cfg_lines(features: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the sorted `CFG` lines for a BEL's feature names.
+
+    Parameters
+    ----------
+    features : tuple[str, ...]
+        Feature names of the BEL, in any order.
+
+    Returns
+    -------
+    tuple[str, ...]
+        One `CFG,<feature>` line per feature, sorted by feature name.
+    """
+    return tuple(f"CFG,{feat}" for feat in sorted(features))
+
+
 def belLines(
-    bel: Bel, letter: str, x: int, y: int
+    bel: Bel,
+    letter: str,
+    x: int,
+    y: int,
+    cfg_lines: tuple[str, ...] | None = None,
 ) -> tuple[str, list[str], list[str], list[str]]:
     """Build a BEL's legacy v1 line, its v2/v3 blocks, and any pin constraint.
 
@@ -124,6 +147,9 @@ def belLines(
         Tile X coordinate the BEL belongs to.
     y : int
         Tile Y coordinate the BEL belongs to.
+    cfg_lines : tuple[str, ...] | None, optional
+        The BEL's sorted `CFG` lines, if already known. Built from the BEL's
+        feature map when None.
 
     Returns
     -------
@@ -134,20 +160,24 @@ def belLines(
     cType = bel.name
     if bel.name in ("LUT4c_frame_config", "LUT4c_frame_config_dffesr"):
         cType = "FABULOUS_LC"
-    v1_line = (
-        f"X{x}Y{y},X{x},Y{y},{letter},{cType},{','.join(bel.inputs + bel.outputs)}"
-    )
+    xy = f"X{x}Y{y}"
+    v1_line = f"{xy},X{x},Y{y},{letter},{cType},{','.join(bel.inputs + bel.outputs)}"
     inputs = [p.removeprefix(bel.prefix) for p in bel.inputs]
     outputs = [p.removeprefix(bel.prefix) for p in bel.outputs]
+    if cfg_lines is None:
+        cfg_lines = _cfg_lines(tuple(bel.belFeatureMap))
 
     def block(timing: bool) -> list[str]:
-        lines = [f"BelBegin,X{x}Y{y},{letter},{cType},{bel.prefix}"]
-        for inp, stripped in zip(bel.inputs, inputs, strict=True):
-            lines.append(f"I,{stripped},X{x}Y{y}.{inp}")
-        for outp, stripped in zip(bel.outputs, outputs, strict=True):
-            lines.append(f"O,{stripped},X{x}Y{y}.{outp}")
-        for feat, _cfg in sorted(bel.belFeatureMap.items(), key=lambda x: x[0]):
-            lines.append(f"CFG,{feat}")
+        lines = [f"BelBegin,{xy},{letter},{cType},{bel.prefix}"]
+        lines.extend(
+            f"I,{stripped},{xy}.{inp}"
+            for inp, stripped in zip(bel.inputs, inputs, strict=True)
+        )
+        lines.extend(
+            f"O,{stripped},{xy}.{outp}"
+            for outp, stripped in zip(bel.outputs, outputs, strict=True)
+        )
+        lines.extend(cfg_lines)
         if timing and cType == "FABULOUS_LC":
             lutInputs = [p for p in inputs if p.startswith("I") and p[1:].isdigit()]
             lines.append("Clock,CLK,FF=1")
@@ -183,7 +213,7 @@ def belLines(
     v3_lines = block(timing=True)
 
     constrain_lines = (
-        [f"set_io Tile_X{x}Y{y}_{letter} Tile_X{x}Y{y}.{letter}"]
+        [f"set_io Tile_{xy}_{letter} Tile_{xy}.{letter}"]
         if bel.name in IO_BEL_TYPES
         else []
     )
@@ -211,88 +241,189 @@ def genNextpnrModel(
         - belv2Str: A string with new style BEL definitions.
         - belv3Str: A string with new style BEL definitions including timing.
         - constrainStr: A string with constraint definitions.
+    """
+    buffers = [io.StringIO() for _ in range(5)]
+    write_nextpnr_model(fabric, *buffers, delay_model=delay_model)
+    pipStr, belStr, belv2Str, belv3Str, constrainStr = (
+        buf.getvalue().removesuffix("\n") for buf in buffers
+    )
+    return pipStr, belStr, belv2Str, belv3Str, constrainStr
+
+
+def write_nextpnr_model(
+    fabric: Fabric,
+    pip_file: TextIO,
+    bel_file: TextIO,
+    belv2_file: TextIO,
+    belv3_file: TextIO,
+    constrain_file: TextIO,
+    delay_model: FABulousTimingModelInterface = None,
+) -> None:
+    """Stream the fabric's nextpnr model into open text files.
+
+    The pip description of a large fabric runs to many megabytes, so lines are
+    written out as they are generated instead of being collected in memory.
+    Every line, including the last one, is terminated by a newline. Pips come
+    from `write_nextpnr_pips`, which raises InvalidState for a wire that leaves
+    the fabric.
+
+    Parameters
+    ----------
+    fabric : Fabric
+        Fabric object containing tile information.
+    pip_file : TextIO
+        Receives the tile-internal and tile-external pip descriptions.
+    bel_file : TextIO
+        Receives the old style BEL definitions.
+    belv2_file : TextIO
+        Receives the new style BEL definitions.
+    belv3_file : TextIO
+        Receives the new style BEL definitions including timing.
+    constrain_file : TextIO
+        Receives the constraint definitions.
+    delay_model : FABulousTimingModelInterface, optional
+        Timing model interface to provide delay information, by default None.
+    """
+    write_nextpnr_pips(fabric, pip_file, delay_model)
+    write_nextpnr_bels(fabric, bel_file, belv2_file, belv3_file, constrain_file)
+
+
+def write_nextpnr_pips(
+    fabric: Fabric,
+    pip_file: TextIO,
+    delay_model: FABulousTimingModelInterface = None,
+) -> None:
+    """Stream the fabric's nextpnr pip description into an open text file.
+
+    Parameters
+    ----------
+    fabric : Fabric
+        Fabric object containing tile information.
+    pip_file : TextIO
+        Receives the tile-internal and tile-external pip descriptions.
+    delay_model : FABulousTimingModelInterface, optional
+        Timing model interface to provide delay information, by default None.
 
     Raises
     ------
     InvalidState
         If a wire in a tile points to an invalid tile outside the fabric bounds.
     """
-    pipStr = []
-    belStr = []
-    belv2Str = []
-    belv3Str = []
-    belStr.append(
-        f"# BEL descriptions: top left corner Tile_X0Y0,"
-        f" bottom right Tile_X{fabric.numberOfColumns}Y{fabric.numberOfRows}"
+    max_column = fabric.numberOfColumns
+    max_row = fabric.numberOfRows
+
+    # The interface memoises delays per (tile, src, dst) pip, so instances of
+    # a tile type only reach the timing model once. Without a model the delay
+    # is picked once here rather than tested for on every pip.
+    pip_delay = (
+        delay_model.pip_delay if delay_model is not None else lambda *_: DUMMY_PIP_DELAY
     )
-    belv2Str.append(
-        f"# BEL descriptions: top left corner Tile_X0Y0, "
-        f"bottom right Tile_X{fabric.numberOfColumns}Y{fabric.numberOfRows}"
-    )
-    belv3Str.append(
-        f"# BEL descriptions: top left corner Tile_X0Y0, "
-        f"bottom right Tile_X{fabric.numberOfColumns}Y{fabric.numberOfRows}"
-    )
-    constrainStr = []
 
     for y, row in enumerate(fabric.tile):
         for x, tile in enumerate(row):
             if tile is None:
                 continue
-            pipStr.append(f"#Tile-internal pips on tile X{x}Y{y}:")
+            xy = f"X{x}Y{y}"
+            pip_file.write(f"#Tile-internal pips on tile {xy}:\n")
             for source, sinkList in tile.switch_matrix.connections.items():
                 for sink in sinkList:
-                    delay: float = DUMMY_PIP_DELAY
-                    if delay_model is not None:
-                        delay = delay_model.pip_delay(tile.name, sink, source)
-                    pipStr.append(
-                        f"X{x}Y{y},{sink},X{x}Y{y},{source},{delay},{sink}.{source}"
+                    delay = pip_delay(tile.name, sink, source)
+                    pip_file.write(
+                        f"{xy},{sink},{xy},{source},{delay},{sink}.{source}\n"
                     )
 
-            pipStr.append(f"#Tile-external pips on tile X{x}Y{y}:")
+            pip_file.write(f"#Tile-external pips on tile {xy}:\n")
             for wire in tile.wireList:
                 xDst = x + wire.xOffset
                 yDst = y + wire.yOffset
-                if (not (0 <= xDst <= fabric.numberOfColumns)) or (
-                    not (0 <= yDst <= fabric.numberOfRows)
-                ):
+                if not (0 <= xDst <= max_column and 0 <= yDst <= max_row):
                     raise InvalidState(
-                        f"Wire {wire} in tile X{x}Y{y} points to an invalid tile "
+                        f"Wire {wire} in tile {xy} points to an invalid tile "
                         f"X{xDst}Y{yDst}. "
                         "Please check your tile CSV file for unmatching wires/offsets!"
                     )
 
-                delay: float = DUMMY_PIP_DELAY
-                if delay_model is not None:
-                    delay = delay_model.pip_delay(
-                        tile.name,
-                        wire.source,
-                        wire.destination,
-                    )
-                pipStr.append(
-                    f"X{x}Y{y},{wire.source},"
-                    f"X{x + wire.xOffset}Y{y + wire.yOffset},{wire.destination},"
-                    f"{delay},"
-                    f"{wire.source}.{wire.destination}"
-                )
+                src, dst = wire.source, wire.destination
+                delay = pip_delay(tile.name, src, dst)
+                pip_file.write(f"{xy},{src},X{xDst}Y{yDst},{dst},{delay},{src}.{dst}\n")
+
+    # Supertile switch-matrix PIP emission.
+    # SJUMP PIPs live in tile.wireList (added by Fabric.__post_init__) and are
+    # already emitted by the per-tile loop above.
+    for base_fx, base_fy, super_tile in fabric.iter_super_tile_placements():
+        if (
+            not super_tile.bels and super_tile.supertile_matrix_dir is None
+        ) or super_tile.switch_matrix is None:
+            continue
+        tx_local, ty_local = super_tile.get_master_tile_coords()
+        fxy = f"X{base_fx + tx_local}Y{base_fy + ty_local}"
+        for sink, sources in super_tile.switch_matrix.connections.items():
+            for src in sources:
+                delay = pip_delay(super_tile.name, sink, src)
+                pip_file.write(f"{fxy},{src},{fxy},{sink},{delay},{src}.{sink}\n")
+
+
+def write_nextpnr_bels(
+    fabric: Fabric,
+    bel_file: TextIO,
+    belv2_file: TextIO,
+    belv3_file: TextIO,
+    constrain_file: TextIO,
+) -> None:
+    """Stream the fabric's nextpnr BEL definitions into open text files.
+
+    Parameters
+    ----------
+    fabric : Fabric
+        Fabric object containing tile information.
+    bel_file : TextIO
+        Receives the old style BEL definitions.
+    belv2_file : TextIO
+        Receives the new style BEL definitions.
+    belv3_file : TextIO
+        Receives the new style BEL definitions including timing.
+    constrain_file : TextIO
+        Receives the constraint definitions.
+    """
+    max_column = fabric.numberOfColumns
+    max_row = fabric.numberOfRows
+    bel_file.write(
+        f"# BEL descriptions: top left corner Tile_X0Y0,"
+        f" bottom right Tile_X{max_column}Y{max_row}\n"
+    )
+    belv2_file.write(
+        f"# BEL descriptions: top left corner Tile_X0Y0, "
+        f"bottom right Tile_X{max_column}Y{max_row}\n"
+    )
+    belv3_file.write(
+        f"# BEL descriptions: top left corner Tile_X0Y0, "
+        f"bottom right Tile_X{max_column}Y{max_row}\n"
+    )
+
+    # Every tile instance carries its own copy of a BEL and its feature map, so
+    # the CFG lines are memoised on the feature names to sort each BEL type once.
+    cfg_lines = cache(_cfg_lines)
 
+    for y, row in enumerate(fabric.tile):
+        for x, tile in enumerate(row):
+            if tile is None:
+                continue
+            xy = f"X{x}Y{y}"
             # BEL definitions: legacy v1, and new-style v2 / v3 (with timing arcs).
-            belStr.append(f"#Tile_X{x}Y{y}")
-            belv2Str.append(f"#Tile_X{x}Y{y}")
-            belv3Str.append(f"#Tile_X{x}Y{y}")
+            bel_file.write(f"#Tile_{xy}\n")
+            belv2_file.write(f"#Tile_{xy}\n")
+            belv3_file.write(f"#Tile_{xy}\n")
             for i, bel in enumerate(tile.bels):
-                letter = string.ascii_uppercase[i]
+                letter = BEL_LETTERS[i]
                 v1_line, v2_lines, v3_lines, constrain_lines = belLines(
-                    bel, letter, x, y
+                    bel, letter, x, y, cfg_lines(tuple(bel.belFeatureMap))
                 )
-                belStr.append(v1_line)
-                belv2Str.extend(v2_lines)
-                belv3Str.extend(v3_lines)
-                constrainStr.extend(constrain_lines)
+                bel_file.write(f"{v1_line}\n")
+                belv2_file.write("\n".join(v2_lines) + "\n")
+                belv3_file.write("\n".join(v3_lines) + "\n")
+                constrain_file.writelines(f"{line}\n" for line in constrain_lines)
 
-    # Supertile BEL and switch-matrix PIP emission.
-    # SJUMP PIPs live in tile.wireList (added by Fabric.__post_init__) and are
-    # already emitted by the per-tile loop above.
+    # Supertile BELs follow the BELs of the supertile's master tile.
     for base_fx, base_fy, super_tile in fabric.iter_super_tile_placements():
         if not super_tile.bels and super_tile.supertile_matrix_dir is None:
             continue
@@ -300,38 +431,21 @@ def genNextpnrModel(
         tx_local, ty_local = super_tile.get_master_tile_coords()
         ftx = base_fx + tx_local
         fty = base_fy + ty_local
+        fxy = f"X{ftx}Y{fty}"
 
         bel_offset = len(fabric.tile[fty][ftx].bels)
-        belStr.append(f"#SuperTile_{super_tile.name}_X{ftx}Y{fty}")
-        belv2Str.append(f"#SuperTile_{super_tile.name}_X{ftx}Y{fty}")
-        belv3Str.append(f"#SuperTile_{super_tile.name}_X{ftx}Y{fty}")
+        bel_file.write(f"#SuperTile_{super_tile.name}_{fxy}\n")
+        belv2_file.write(f"#SuperTile_{super_tile.name}_{fxy}\n")
+        belv3_file.write(f"#SuperTile_{super_tile.name}_{fxy}\n")
         for i, bel in enumerate(super_tile.bels):
-            letter = string.ascii_uppercase[bel_offset + i]
+            letter = BEL_LETTERS[bel_offset + i]
             v1_line, v2_lines, v3_lines, constrain_lines = belLines(
-                bel, letter, ftx, fty
+                bel, letter, ftx, fty, cfg_lines(tuple(bel.belFeatureMap))
             )
-            belStr.append(v1_line)
-            belv2Str.extend(v2_lines)
-            belv3Str.extend(v3_lines)
-            constrainStr.extend(constrain_lines)
-
-        if super_tile.switch_matrix is not None:
-            for sink, sources in super_tile.switch_matrix.connections.items():
-                for src in sources:
-                    delay: float = DUMMY_PIP_DELAY
-                    if delay_model is not None:
-                        delay = delay_model.pip_delay(super_tile.name, sink, src)
-                    pipStr.append(
-                        f"X{ftx}Y{fty},{src},X{ftx}Y{fty},{sink},{delay},{src}.{sink}"
-                    )
-
-    return (
-        "\n".join(pipStr),
-        "\n".join(belStr),
-        "\n".join(belv2Str),
-        "\n".join(belv3Str),
-        "\n".join(constrainStr),
-    )
+            bel_file.write(f"{v1_line}\n")
+            belv2_file.write("\n".join(v2_lines) + "\n")
+            belv3_file.write("\n".join(v3_lines) + "\n")
+            constrain_file.writelines(f"{line}\n" for line in constrain_lines)
 
 
 def writeNextpnrPipFile(
@@ -350,5 +464,5 @@ def writeNextpnrPipFile(
     delay_model : FABulousTimingModelInterface, optional
         Timing model interface to provide delay information, by default None.
     """
-    pip_str, *_ = genNextpnrModel(fabric, delay_model)
-    outputFile.write_text(pip_str, encoding="utf-8")
+    with outputFile.open("w", encoding="utf-8") as pip_file:
+        write_nextpnr_pips(fabric, pip_file, delay_model)
@@ -9,6 +9,7 @@ and external PIPs (Programmable Interconnect Points) using either structural or
 approaches.
 """
 
+import os
 import re
 from pathlib import Path
 
@@ -28,6 +29,32 @@ from fabulous.fabric_cad.timing_model.tools.synth_tools.yosys import YosysTool
 from fabulous.fabric_definition.fabric import Fabric
 from fabulous.fabric_definition.supertile import SuperTile
 
+# Ports with indices, e.g., NN2BEG3 -> NN2BEG[3]
+_PORT_INDEX_PATTERN = re.compile(r"^(.*?)(\d+)$")
+
+
+def _split_literal_patterns(
+    patterns: list[str] | None,
+) -> tuple[tuple[str, ...], list[re.Pattern]]:
+    """Split regex patterns into plain substrings and compiled regexes.
+
+    A pattern without regex metacharacters only matches where it occurs as a
+    substring, so it can be tested with `in` instead of a regex search.
+
+    Parameters
+    ----------
+    patterns : list[str] | None
+        Regex patterns to split.
+
+    Returns
+    -------
+    tuple[tuple[str, ...], list[re.Pattern]]
+        The plain substrings and the compiled remaining patterns.
+    """
+    words = tuple(p for p in (patterns or []) if re.escape(p) == p)
+    regexes = [re.compile(p) for p in (patterns or []) if re.escape(p) != p]
+    return words, regexes
+
 
 class FABulousTileTimingModel:
     """Reads the FABulous project files and extracts timing information.
@@ -91,7 +118,7 @@ class FABulousTileTimingModel:
 
         self.switch_matrix_hier_path: list[str] | None = None
         self.switch_matrix_module_name: list[str] | None = None
-        self.internal_pips_grouped_by_inst: dict[str, list[str]] | None = None
+        self.internal_pips_grouped_by_inst = None
         self.internal_pips: list[str] | None = None
         self._extract_switch_matrix_info()
 
@@ -99,6 +126,27 @@ class FABulousTileTimingModel:
 
         logger.info("FABulous Timing Model initialized.")
 
+    @property
+    def internal_pips_grouped_by_inst(self) -> dict[str, list[str]] | None:
+        """Nets of the switch matrix, grouped by the mux instance they connect to."""
+        return self._internal_pips_grouped_by_inst
+
+    @internal_pips_grouped_by_inst.setter
+    def internal_pips_grouped_by_inst(self, value: dict[str, list[str]] | None) -> None:
+        """Store the grouped nets and rebuild the net to instance index.
+
+        `is_tile_internal_pip` runs for every pip of the fabric, so the mapping
+        is inverted once here instead of scanning every instance per query.
+        """
+        self._internal_pips_grouped_by_inst = value
+        net_to_insts: dict[str, set[str]] = {}
+        for inst, nets in (value or {}).items():
+            for net in nets:
+                net_to_insts.setdefault(net, set()).add(inst)
+        self._net_to_insts: dict[str, frozenset[str]] = {
+            net: frozenset(insts) for net, insts in net_to_insts.items()
+        }
+
     def _get_project_rtl_files(self) -> None:
         """Find all the Verilog files for the tile in the project directory.
 
@@ -363,21 +411,42 @@ class FABulousTileTimingModel:
             raise TypeError("root_dir must be a Path object.")
 
         file_re = re.compile(file_pattern)
-        exclude_dir_res = [re.compile(p) for p in (exclude_dir_patterns or [])]
-        exclude_file_res = [re.compile(p) for p in (exclude_file_patterns or [])]
+        exclude_dir_words, exclude_dir_res = _split_literal_patterns(
+            exclude_dir_patterns
+        )
+        exclude_file_words, exclude_file_res = _split_literal_patterns(
+            exclude_file_patterns
+        )
         matched_files: list[Path] = []
 
-        for dirpath, dirnames, filenames in root_dir.walk():
-            dirnames[:] = [
-                d for d in dirnames if not any(r.search(d) for r in exclude_dir_res)
-            ]
-
-            for fname in filenames:
-                if any(r.search(fname) for r in exclude_file_res):
-                    continue
-                if file_re.search(fname):
-                    matched_files.append(dirpath / fname)
-
+        # os.scandir hands out the entry names with a cached file type, so no
+        # per-directory name lists or Path objects are built for the walk.
+        def walk(directory: str) -> None:
+            subdirs: list[str] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if not any(
+                                w in name for w in exclude_dir_words
+                            ) and not any(r.search(name) for r in exclude_dir_res):
+                                subdirs.append(entry.path)
+                        elif (
+                            file_re.search(name)
+                            and not any(w in name for w in exclude_file_words)
+                            and not any(r.search(name) for r in exclude_file_res)
+                        ):
+                            matched_files.append(Path(entry.path))
+            except OSError:
+                # Like Path.walk, skip a directory that cannot be read, and
+                # return nothing for a missing root_dir.
+                return
+            # Descend after the files, keeping the order of a top-down walk.
+            for subdir in subdirs:
+                walk(subdir)
+
+        walk(str(root_dir))
         return matched_files
 
     def _extract_switch_matrix_info(self) -> None:
@@ -446,12 +515,13 @@ class FABulousTileTimingModel:
             )
 
         else:
+            tile_name = self.tile_name
             self.switch_matrix_hier_path = [
-                p for p in self.switch_matrix_hier_path if self.tile_name in p
+                p for p in self.switch_matrix_hier_path if tile_name in p
             ]
 
             self.switch_matrix_module_name = [
-                m for m in self.switch_matrix_module_name if self.tile_name in m
+                m for m in self.switch_matrix_module_name if tile_name in m
             ]
 
             if (
@@ -507,16 +577,14 @@ class FABulousTileTimingModel:
         bool
             True if both PIPs are internal PIPs of the switch matrix, False otherwise.
         """
-        instance_to_nets = self.internal_pips_grouped_by_inst
-
-        if instance_to_nets is None or pip_src == pip_dst:
+        if pip_src == pip_dst:
             return False
 
-        target = set([pip_src, pip_dst])
-        for _inst, net_list in instance_to_nets.items():
-            if target.issubset(set(net_list)):
-                return True
-        return False
+        src_insts = self._net_to_insts.get(pip_src)
+        dst_insts = self._net_to_insts.get(pip_dst)
+        if src_insts is None or dst_insts is None:
+            return False
+        return not src_insts.isdisjoint(dst_insts)
 
     def internal_pip_delay_structural(self, pip_src: str, pip_dst: str) -> float:
         """Calculate delay between two PIPs in the switch matrix.
@@ -815,8 +883,8 @@ class FABulousTileTimingModel:
         default_delay: float = 0.001
 
         # Must do for ports with indices, e.g., NN2BEG3 -> NN2BEG[3]
-        pip_src_port = re.sub(r"^(.*?)(\d+)$", r"\1[\2]", pip_src)
-        pip_dst_port = re.sub(r"^(.*?)(\d+)$", r"\1[\2]", pip_dst)
+        pip_src_port = _PORT_INDEX_PATTERN.sub(r"\1[\2]", pip_src)
+        pip_dst_port = _PORT_INDEX_PATTERN.sub(r"\1[\2]", pip_dst)
 
         # Tile interconnects, stitched fixed delay almost 0.
         if pip_src_port in synth_model.output_ports:
@@ -909,8 +977,8 @@ class FABulousTileTimingModel:
         default_delay: float = 0.001
 
         # Must do for ports with indices, e.g., NN2BEG3 -> NN2BEG[3]
-        pip_src_port = re.sub(r"^(.*?)(\d+)$", r"\1[\2]", pip_src)
-        pip_dst_port = re.sub(r"^(.*?)(\d+)$", r"\1[\2]", pip_dst)
+        pip_src_port = _PORT_INDEX_PATTERN.sub(r"\1[\2]", pip_src)
+        pip_dst_port = _PORT_INDEX_PATTERN.sub(r"\1[\2]", pip_dst)
 
         # Tile interconnects, stitched fixed delay almost 0.
         if pip_src_port in phys_model.output_ports:
@@ -1027,11 +1095,8 @@ class FABulousTileTimingModel:
         float
             Calculated delay in nanoseconds for the PIP.
         """
-        d_scale: float = self.tm_config.delay_scaling_factor
-
-        def _round(x: float) -> float:
-            return round(x * d_scale, 3)
-
         if self.is_tile_internal_pip(pip_src, pip_dst):
-            return _round(self.internal_pip_delay(pip_src, pip_dst))
-        return _round(self.external_pip_delay(pip_src, pip_dst))
+            delay = self.internal_pip_delay(pip_src, pip_dst)
+        else:
+            delay = self.external_pip_delay(pip_src, pip_dst)
+        return round(delay * self.tm_config.delay_scaling_factor, 3)
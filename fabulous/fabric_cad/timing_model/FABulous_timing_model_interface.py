@@ -7,6 +7,8 @@ It uses the FABulousTileTimingModel to compute delays for individual tiles and c
 the results for efficient retrieval.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
 
 from fabulous.fabric_cad.timing_model.FABulous_timing_model import (
@@ -16,6 +18,7 @@ from fabulous.fabric_cad.timing_model.models import (
     TimingModelConfig,
 )
 from fabulous.fabric_definition.fabric import Fabric
+from fabulous.fabulous_settings import get_context
 
 
 class FABulousTimingModelInterface:
@@ -39,7 +42,7 @@ class FABulousTimingModelInterface:
     def __init__(self, config: TimingModelConfig, fabric: Fabric) -> None:
         self.config: TimingModelConfig = config
         self.fabric: Fabric = fabric
-        self.tile_delay_dict: dict[str, dict[str, float]] = {}
+        self.tile_delay_dict: dict[str, dict[tuple[str, str], float]] = {}
 
         self.timing_models: dict[str, FABulousTileTimingModel] = {}
 
@@ -47,12 +50,21 @@ class FABulousTimingModelInterface:
             f"Initializing timing models for tiles, with mode: {self.config.mode}"
         )
 
-        for tile_name, _tile in self.fabric.tileDic.items():
-            model_config = self.config.model_copy(deep=True)
-            timing_model = FABulousTileTimingModel(
-                config=model_config, fabric=self.fabric, tile_name=tile_name
+        # Each model spends most of its setup in Yosys and OpenSTA subprocesses,
+        # so tiles are built on threads. Every tool run writes to its own
+        # temporary file, so tiles that synthesise the same design do not clash.
+        def build(tile_name: str) -> FABulousTileTimingModel:
+            return FABulousTileTimingModel(
+                config=self.config.model_copy(deep=True),
+                fabric=self.fabric,
+                tile_name=tile_name,
             )
-            self.timing_models[tile_name] = timing_model
+
+        with ThreadPoolExecutor(
+            max_workers=get_context().max_worker or None
+        ) as executor:
+            for timing_model in executor.map(build, self.fabric.tileDic):
+                self.timing_models[timing_model.tile_name] = timing_model
 
     def pip_delay(self, tile_name: str, src_pip: str, dst_pip: str) -> float:
         """Get the delay for a given pip in the timing model.
@@ -82,23 +94,27 @@ class FABulousTimingModelInterface:
         """
         # The used key to store/retrieve the delay, if the delay for the
         # same src and dst pip was already computed before, the delay
-        # will be retrieved from the cache.
-        key: str = f"{src_pip}.{dst_pip}"
+        # will be retrieved from the cache. A tuple keeps pips whose names
+        # contain dots apart, which a joined "src.dst" string would not.
+        key: tuple[str, str] = (src_pip, dst_pip)
 
-        if tile_name not in self.timing_models:
+        timing_model = self.timing_models.get(tile_name)
+        if timing_model is None:
             raise ValueError(f"Timing model for tile {tile_name!r} not found.")
 
-        if tile_name not in self.tile_delay_dict:
-            self.tile_delay_dict[tile_name] = {}
-
-        if key in self.tile_delay_dict[tile_name]:
-            logger.info(
-                f"Using cached delay for key {key!r} in tile {tile_name!r} "
-                f"with delay {self.tile_delay_dict[tile_name][key]}"
+        tile_delays = self.tile_delay_dict.setdefault(tile_name, {})
+        delay = tile_delays.get(key)
+        if delay is not None:
+            # Hits outnumber misses by far, so they are only traced and the
+            # message is formatted by loguru only when a sink accepts it.
+            logger.trace(
+                "Using cached delay for key {!r} in tile {!r} with delay {}",
+                key,
+                tile_name,
+                delay,
             )
-            return self.tile_delay_dict[tile_name][key]
+            return delay
 
-        timing_model = self.timing_models[tile_name]
         delay = timing_model.pip_delay(src_pip, dst_pip)
-        self.tile_delay_dict[tile_name][key] = delay
+        tile_delays[key] = delay
         return delay
@@ -10,6 +10,8 @@ It then uses the VerilogGateLevelTimingGraph class to generate a timing graph fr
 gate-level netlist.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
 
 from fabulous.fabric_cad.timing_model.hdlnx.verilog_gate_level import (
@@ -78,12 +80,21 @@ class HdlnxTimingModel(VerilogGateLevelTimingGraph):
         _sta_tool.sta_design_name = self.synth_tool.synth_design_name
         _sta_tool.sta_liberty_files = self.synth_tool.synth_liberty_files
 
-        super().__init__(
-            top_name=self.synth_tool.synth_design_name,
-            sta_tool=_sta_tool,
-            delay_type_str=delay_type_str,
-            debug=debug,
-        )
-
-        self.verilog_netlist_content: str = synth_tool.synth_netlist_file.read_text()
-        synth_tool.synth_clean_up()
+        # Remove the temporary netlist even if timing graph generation fails.
+        try:
+            self.verilog_netlist_content: str = (
+                synth_tool.synth_netlist_file.read_text()
+            )
+            # Parse the netlist while the STA subprocess runs; waiting on it
+            # releases the GIL, so the parse is off the critical path.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                netlist_parsed = executor.submit(self._build_netlist_index)
+                super().__init__(
+                    top_name=self.synth_tool.synth_design_name,
+                    sta_tool=_sta_tool,
+                    delay_type_str=delay_type_str,
+                    debug=debug,
+                )
+                netlist_parsed.result()
+        finally:
+            synth_tool.synth_clean_up()
@@ -9,7 +9,8 @@ algorithms based on the SDF, and should not contain high-level algorithms based
 verilog netlists.
 """
 
-from math import isclose
+from collections import deque
+from math import inf, isclose
 
 import networkx as nx
 
@@ -76,7 +77,10 @@ class SDFTimingGraph(SDFTimingGraphBase):
         --------
             length = sdf_graph.single_delay("nodeA/pin", "nodeB/pin")
         """
-        length: float = nx.dijkstra_path_length(
+        # Growing the search from both ends settles far fewer nodes than a
+        # one-sided Dijkstra when source and target sit deep in a large tile.
+        length: float
+        length, _path = nx.bidirectional_dijkstra(
             self.graph, source=source, target=target, weight="weight"
         )
         return length
@@ -133,7 +137,8 @@ class SDFTimingGraph(SDFTimingGraphBase):
               or [] if none exists
             - best_cost: minimal cost of the chosen node,
               or None if no common node exists
-            - dists: source -> node -> distance
+            - dists: source -> node -> distance; if no common node exists, only
+              for the sources searched until that was known
 
         Raises
         ------
@@ -153,15 +158,15 @@ class SDFTimingGraph(SDFTimingGraphBase):
 
         # Compute distances from each source to all reachable nodes.
         dists: dict[str, dict[str, float]] = {}
-        for s in sources:
-            # Compute shortest-path distances from each source.
-            dists[s] = nx.single_source_shortest_path_length(self.graph, s, cutoff=stop)
 
         # Fast path for single source: just return the source.
         # Or follow the path to the sentinel if requested and possible
         # and return that follwed node as the earliest node instead.
         if len(sources) == 1:
             source = sources[0]
+            dists[source] = nx.single_source_shortest_path_length(
+                self.graph, source, cutoff=stop
+            )
             if (
                 prefer_sentinel_for_single_source
                 and sentinel is not None
@@ -174,13 +179,18 @@ class SDFTimingGraph(SDFTimingGraphBase):
                 return [chosen], dists[source][chosen], dists
             return [source], 0.0, dists
 
-        # Keep only nodes reachable from every source.
-        common = set(dists[sources[0]].keys())
-        for s in sources[1:]:
-            common &= set(dists[s].keys())
-
-        if not common:
-            return [], None, dists
+        # Keep only the nodes reachable from every source searched so far.
+        # Once that set is empty no common node can exist, so the remaining
+        # sources are not searched.
+        common: set[str] | None = None
+        for s in sources:
+            dists[s] = nx.single_source_shortest_path_length(self.graph, s, cutoff=stop)
+            if common is None:
+                common = set(dists[s])
+            else:
+                common.intersection_update(dists[s])
+            if not common:
+                return [], None, dists
 
         # Builds a new graph containing only the nodes that are reachable
         # from all sources. So from now on, the code ignores nodes that are
@@ -211,14 +221,25 @@ class SDFTimingGraph(SDFTimingGraphBase):
         earliest_scc_ids = {i for i, indeg in scc_indegree.items() if indeg == 0}
         candidates = [node for node in common if node_to_scc[node] in earliest_scc_ids]
 
-        def cost(v: str) -> float:
-            """Compute the cost of a node based on the selected mode."""
-            if mode == "sum":
-                return sum(dists[s][v] for s in sources)
-            return max(dists[s][v] for s in sources)
-
-        candidate_costs = {v: cost(v) for v in candidates}
-        best_cost = min(candidate_costs.values())
+        aggregate = sum if mode == "sum" else max
+        source_dists = [dists[s] for s in sources]
+        first_dists = source_dists[0]
+
+        # Distances are non-negative, so in both modes the cost of v is at least
+        # its distance from the first source. Walking the candidates by that
+        # distance, no later candidate can tie or beat the best cost once the
+        # bound exceeds it.
+        candidate_costs: dict[str, float] = {}
+        best_cost = inf
+        for v in sorted(candidates, key=first_dists.__getitem__):
+            bound = first_dists[v]
+            if bound > best_cost and not isclose(
+                bound, best_cost, rel_tol=1e-12, abs_tol=1e-12
+            ):
+                break
+            cost = aggregate(d[v] for d in source_dists)
+            candidate_costs[v] = cost
+            best_cost = min(best_cost, cost)
 
         # First tie-break step: keep only nodes with minimal cost.
         cost_tied = [
@@ -274,11 +295,12 @@ class SDFTimingGraph(SDFTimingGraphBase):
             The hierarchical pin path reached after following the fanout.
         """
         current_pin: str = hier_pin_path
+        successors = self.graph.successors
         for _ in range(num_follow):
-            successors = next(self.graph.successors(current_pin), None)
-            if successors is None:
+            next_pin = next(successors(current_pin), None)
+            if next_pin is None:
                 break
-            current_pin = successors
+            current_pin = next_pin
         return current_pin
 
     def path_to_nearest_target_sentinel(
@@ -286,13 +308,16 @@ class SDFTimingGraph(SDFTimingGraphBase):
         source: str,
         targets: list[str],
         weight: str | None = None,
-        sentinel_prefix: str = "_sentinel_",
         reverse: bool = False,
     ) -> tuple[list[str], str]:
-        """Shortest path to nearest target using sentinel-node trick.
+        """Shortest path to the nearest target.
 
         Find the shortest path from `source` to the nearest node in `targets`
-        in a (directed) NetworkX graph using the sentinel-node trick.
+        in a (directed) NetworkX graph. Rather than wiring a sentinel node to
+        every target, a multi-source search runs from the targets over the
+        opposite edge direction until it reaches `source`, so the graph is never
+        modified. Unweighted searches are breadth-first, weighted ones use
+        Dijkstra.
         https://networkx.org/documentation/stable/reference/algorithms/shortest_paths.html
 
         Parameters
@@ -300,12 +325,10 @@ class SDFTimingGraph(SDFTimingGraphBase):
         source : str
             Source node.
         targets : list[str]
-            List of target nodes.
+            List of target nodes. Nodes missing from the graph are ignored.
         weight : str | None, optional
             Edge attribute name to use as weight. If None, the graph is treated
             as unweighted (hop count).
-        sentinel_prefix : str, optional
-            Base name for the temporary sentinel node (ensured to be unique).
         reverse : bool
             If True, find the shortest path from the nearest target to the source
             instead (i.e., reverse the graph direction).
@@ -313,7 +336,7 @@ class SDFTimingGraph(SDFTimingGraphBase):
         Returns
         -------
         path : list[str]
-            List of nodes from `source` to the closest target (no sentinel),
+            List of nodes from `source` to the closest target,
             or None if no target is reachable.
         closest_target : str
             The closest target node, or None if no target is reachable.
@@ -322,41 +345,90 @@ class SDFTimingGraph(SDFTimingGraphBase):
         ------
         ValueError
             If `targets` is empty.
+        nx.NodeNotFound
+            If `source` is not in the graph.
         """
-        G = self.reverse_graph if reverse else self.graph
-        targets: set[str] = set(targets)
         if not targets:
             raise ValueError("targets must be a non-empty iterable of nodes")
 
-        # Pick a sentinel name that doesn't collide with existing nodes
-        sentinel: str = f"{sentinel_prefix}_i89f9j9g58f7g6e5d4c3b2a1"
-
-        G.add_node(sentinel)
+        # Searching from the targets walks the edges against the direction of
+        # the path, so use the graph opposite to the requested one.
+        G = self.graph if reverse else self.reverse_graph
+        # A mistyped pin name must not be reported as "no path".
+        if source not in G:
+            raise nx.NodeNotFound(f"Source {source} is not in G")
+        # Seed in target-list order, so ties go to the first listed target in
+        # every run instead of depending on string hash order.
+        sources = [t for t in dict.fromkeys(targets) if t in G]
+        if not sources:
+            return None, None
 
-        # Add zero-cost edges from each target to the sentinel
         if weight is None:
-            for t in targets:
-                G.add_edge(t, sentinel)
-        else:
-            for t in targets:
-                G.add_edge(t, sentinel, weight=0)
+            # Unit weights: a breadth-first search visits nodes in the same
+            # order as Dijkstra would, without the heap.
+            pred: dict[str, str | None] = dict.fromkeys(sources)
+            queue = deque(sources)
+            while queue and source not in pred:
+                u = queue.popleft()
+                for v in G[u]:
+                    if v not in pred:
+                        pred[v] = u
+                        queue.append(v)
+            if source not in pred:
+                return None, None
+            # Following the predecessors from `source` already walks
+            # towards the target.
+            path = [source]
+            while (u := pred[path[-1]]) is not None:
+                path.append(u)
+            return path, path[-1]
+
         try:
-            # Shortest path (directed) source -> sentinel
-            path: list[str] = nx.shortest_path(
-                G, source=source, target=sentinel, weight=weight
+            _dist, path = nx.multi_source_dijkstra(
+                G, sources, target=source, weight=weight
             )
         except nx.NetworkXNoPath:
-            # Clean up and signal no reachable target
-            G.remove_node(sentinel)
             return None, None
-        finally:
-            # If shortest_path raised, sentinel is still removed here.
-            if sentinel in G:
-                G.remove_node(sentinel)
 
-        # Remove sentinel from the path
-        # The real closest target is the node before the sentinel
-        closest_target: str = path[-2]
-        path_without_sentinel: list[str] = path[:-1]
+        # The search runs target -> source, so flip it to start at `source`.
+        path.reverse()
+        return path, path[-1]
+
+    def nearest_target_map(
+        self, targets: list[str], reverse: bool = False
+    ) -> dict[str, str]:
+        """Nearest target for every node, by hop count.
+
+        Runs the breadth-first search of `path_to_nearest_target_sentinel` once
+        over the whole graph instead of once per source. Both seed the search in
+        target-list order and that search stops as soon as it reaches its
+        source, so it is a prefix of this one and both pick the same target for
+        a node, including the first listed target when several tie.
 
-        return path_without_sentinel, closest_target
+        Parameters
+        ----------
+        targets : list[str]
+            List of target nodes. Nodes missing from the graph are ignored.
+        reverse : bool
+            If True, map each node to the nearest target it is reachable from
+            instead of the nearest target it reaches.
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping from node to its nearest target. Nodes without a reachable
+            target are missing.
+        """
+        G = self.graph if reverse else self.reverse_graph
+        # Seed in target-list order, so ties go to the first listed target in
+        # every run instead of depending on string hash order.
+        sources = [t for t in dict.fromkeys(targets) if t in G]
+        nearest: dict[str, str] = {t: t for t in sources}
+        queue = deque(sources)
+        while queue:
+            u = queue.popleft()
+            for v in G[u]:
+                if v not in nearest:
+                    nearest[v] = nearest[u]
+                    queue.append(v)
+        return nearest
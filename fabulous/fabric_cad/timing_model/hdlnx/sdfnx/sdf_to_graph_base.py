@@ -37,6 +37,10 @@ class SDFTimingGraphBase:
         DelayType.AVG_FAST, DelayType.AVG_SLOW,
         DelayType.MAX_FAST, DelayType.MAX_SLOW, DelayType.MIN_FAST,
         DelayType.MIN_SLOW.
+    keep_raw_sdf : bool
+        If True, keep the SDF text in `sdf_file_content` and the parsed SDF
+        dictionary in `sdf_data_dict`. Both are None otherwise, since a large
+        SDF would stay in memory for as long as the timing graph is used.
 
     Examples
     --------
@@ -44,39 +48,52 @@ class SDFTimingGraphBase:
     """
 
     def __init__(
-        self, sdf_file: Path, delay_type_str: DelayType = DelayType.MAX_ALL
+        self,
+        sdf_file: Path,
+        delay_type_str: DelayType = DelayType.MAX_ALL,
+        keep_raw_sdf: bool = False,
     ) -> None:
         self.sdf_file: Path = sdf_file
-        self.sdf_file_content: str = sdf_file.read_text()
+        sdf_text: str = sdf_file.read_text()
+        self.sdf_file_content: str | None = sdf_text if keep_raw_sdf else None
 
         self.delay_type_str: DelayType = delay_type_str
-        self.sdf_gobject: SDFGobject = gen_timing_digraph(sdf_file, delay_type_str)
+        self.sdf_gobject: SDFGobject = gen_timing_digraph(
+            sdf_file, delay_type_str, sdf_text=sdf_text
+        )
+        if not keep_raw_sdf:
+            self.sdf_gobject.sdf_data = None
 
         self.graph = self.sdf_gobject.nx_graph
-        self.reverse_graph = self.graph.reverse(copy=True)
+        # A read-only view that swaps the graph's successor and predecessor maps,
+        # so it costs no copy and never goes stale if the graph changes.
+        self.reverse_graph = self.graph.reverse(copy=False)
 
         self.header_info: dict = self.sdf_gobject.header_info
-        self.sdf_data_dict: dict = self.sdf_gobject.sdf_data
+        self.sdf_data_dict: dict | None = self.sdf_gobject.sdf_data
         self.cells: list[str] = self.sdf_gobject.cells
         self.instances: dict[str, list[Component]] = self.sdf_gobject.instances
         self.io_paths: list[Component] = self.sdf_gobject.io_paths
         self.interconnects: list[Component] = self.sdf_gobject.interconnects
         self.hier_sep: str = self.sdf_gobject.hier_sep
-
-        self.input_ports = list(
-            {
-                n
-                for n in self.graph.nodes
-                if self.graph.in_degree(n) == 0 and self.hier_sep not in n
-            }
-        )
-        self.output_ports = list(
-            {
-                n
-                for n in self.graph.nodes
-                if self.graph.out_degree(n) == 0 and self.hier_sep not in n
-            }
-        )
+        # Per-instance (c_type, from pin, to pin) lookup, filled on first query.
+        self._component_index: dict[
+            str, dict[tuple[SDFCellType, str, str], Component]
+        ] = {}
+
+        # Top-level ports are the unhierarchical sources and sinks, found in a
+        # single pass over the nodes.
+        self.input_ports: list[str] = []
+        self.output_ports: list[str] = []
+        pred = self.graph.pred
+        succ = self.graph.succ
+        for n in self.graph.nodes:
+            if self.hier_sep in n:
+                continue
+            if not pred[n]:
+                self.input_ports.append(n)
+            if not succ[n]:
+                self.output_ports.append(n)
 
     ### Public Methods ###
 
@@ -101,9 +118,9 @@ class SDFTimingGraphBase:
             A tuple containing the header information dictionary
             and a formatted string.
         """
-        info_str: str = ""
-        for key, value in self.header_info.items():
-            info_str += f"{key}: {value}\n"
+        info_str: str = "".join(
+            f"{key}: {value}\n" for key, value in self.header_info.items()
+        )
         return self.header_info, info_str
 
     def print_graph(self) -> None:
@@ -190,11 +207,11 @@ class SDFTimingGraphBase:
         if instance_name not in self.instances:
             raise KeyError(f"Instance {instance_name} not found in SDF instances.")
 
-        for i in self.instances[instance_name]:
-            if (
-                i.c_type == c_type
-                and i.from_cell_pin == input_pin
-                and i.to_cell_pin == output_pin
-            ):
-                return i
-        return None
+        index = self._component_index.get(instance_name)
+        if index is None:
+            # setdefault keeps the first match, as a linear scan would.
+            index = {}
+            for i in self.instances[instance_name]:
+                index.setdefault((i.c_type, i.from_cell_pin, i.to_cell_pin), i)
+            self._component_index[instance_name] = index
+        return index.get((c_type, input_pin, output_pin))
@@ -4,6 +4,9 @@ This module provides functionality to parse SDF files and generate timing direct
 graphs using NetworkX.
 """
 
+import sys
+from functools import cache
+from itertools import chain
 from pathlib import Path
 
 import networkx as nx
@@ -66,8 +69,8 @@ def delay_type(delay_paths: dict, kind: DelayType = DelayType.MAX_ALL) -> float:
         nmax = _as_float(nominal.get("max"))
         return max(nmin, nmax)
 
-    fast = delay_paths.get("fast", {}) or {}
-    slow = delay_paths.get("slow", {}) or {}
+    fast = delay_paths.get("fast") or {}
+    slow = delay_paths.get("slow") or {}
 
     fast_min: float = _as_float(fast.get("min"))
     fast_max: float = _as_float(fast.get("max"))
@@ -102,6 +105,7 @@ def split_instance_pin(name: str, hier_sep: str) -> tuple[str, str]:
 
     Split a hierarchical name into instance and pin parts based on the separator. For
     example, given the name "_2988_/Q" and separator "/", it returns ("_2988_", "Q").
+    Both parts are interned, since the same names repeat across many components.
 
     Parameters
     ----------
@@ -116,10 +120,12 @@ def split_instance_pin(name: str, hier_sep: str) -> tuple[str, str]:
         A tuple containing the instance and pin names.
     """
     inst, _sep, pin = name.rpartition(hier_sep)
-    return inst, pin
+    return sys.intern(inst), sys.intern(pin)
 
 
-def parse_sdf(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
+def parse_sdf(
+    sdf_file: Path, delay_type_str: DelayType, *, sdf_text: str | None = None
+) -> SDFGobject:
     """Parse the SDF file to extract INTERCONNECT and IOPATH components.
 
     Parse the SDF file to extract INTERCONNECT and IOPATH components with their
@@ -134,6 +140,9 @@ def parse_sdf(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
         Path to the SDF file.
     delay_type_str : DelayType
         The type of delay to extract (e.g., DelayType.MAX_ALL).
+    sdf_text : str | None, optional
+        Content of `sdf_file` if the caller has already read it, so the file
+        is not read a second time.
 
     Returns
     -------
@@ -142,45 +151,49 @@ def parse_sdf(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
         cell names, instance-component mappings, and lists of IOPATH
         and INTERCONNECT components.
     """
-    sdf_data: dict = sdfparse.parse(sdf_file.read_text())
+    if sdf_text is None:
+        sdf_text = sdf_file.read_text()
+    sdf_data: dict = sdfparse.parse(sdf_text)
     header_info: dict = sdf_data.get("header", {})
     io_paths: list[Component] = []
     interconnects: list[Component] = []
     cells: list[str] = list(sdf_data.get("cells", {}).keys())
     instances: dict[str, list[Component]] = {}
     hier_sep: str = header_info.get("divider", "/")
+    # A driver pin appears in one INTERCONNECT per fan-out. The cache lives for
+    # this parse only, so names are not kept alive across tiles.
+    split_pin = cache(split_instance_pin)
 
     for cell_name, cell_data in sdf_data["cells"].items():
         for instance_name, instance_data in cell_data.items():
             if instance_name is not None:
                 instances[instance_name] = []
             for component, component_data in instance_data.items():
-                inst_pin_from: tuple[str, str] = split_instance_pin(
-                    component_data["from_pin"], hier_sep
-                )
-                inst_pin_to: tuple[str, str] = split_instance_pin(
-                    component_data["to_pin"], hier_sep
-                )
-                single_delay: float = delay_type(
-                    component_data["delay_paths"], delay_type_str
-                )
-                one_inst: bool = inst_pin_from[0] == inst_pin_to[0]
+                # Pin names repeat across every instance of a cell, share one
+                # string object per name instead of one per component.
+                from_pin: str = sys.intern(component_data["from_pin"])
+                to_pin: str = sys.intern(component_data["to_pin"])
+                c_type: str = component_data["type"]
+                delay_paths: dict = component_data["delay_paths"]
+                single_delay: float = delay_type(delay_paths, delay_type_str)
 
-                # IOPATH is a combinational path that can change the output
-                # of a cell based on changes to the input.
-                if component_data["type"] == "iopath":
-                    io_paths.append(
+                # INTERCONNECT is a path that connects two different cell instances,
+                # which can be combinational or sequential. Only its pins carry an
+                # instance path that needs splitting off.
+                if c_type == "interconnect":
+                    from_inst, from_inst_pin = split_pin(from_pin, hier_sep)
+                    to_inst, to_inst_pin = split_pin(to_pin, hier_sep)
+                    interconnects.append(
                         Component(
-                            c_type=SDFCellType.IOPATH,
+                            c_type=SDFCellType.INTERCONNECT,
                             cell_name=cell_name,
                             connection_string=component,
-                            from_cell_instance=instance_name,
-                            to_cell_instance=instance_name,
-                            from_cell_pin=component_data["from_pin"],
-                            to_cell_pin=component_data["to_pin"],
+                            from_cell_instance=from_inst,
+                            to_cell_instance=to_inst,
+                            from_cell_pin=from_inst_pin,
+                            to_cell_pin=to_inst_pin,
                             delay=single_delay,
-                            delay_paths=component_data["delay_paths"],
-                            is_one_cell_instance=True,
+                            delay_paths=delay_paths,
                             is_timing_check=component_data["is_timing_check"],
                             is_timing_env=component_data["is_timing_env"],
                             is_absolute=component_data["is_absolute"],
@@ -191,12 +204,42 @@ def parse_sdf(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
                             to_pin_edge=component_data["to_pin_edge"],
                         )
                     )
+                    continue
+
+                # Other components include timing checks (hold, setup, reset,
+                # recover, width) and other types of paths.
+                instance_component = Component(
+                    c_type=SDFCellType(c_type.upper()),
+                    cell_name=cell_name,
+                    connection_string=component,
+                    from_cell_instance=instance_name,
+                    to_cell_instance=instance_name,
+                    from_cell_pin=from_pin,
+                    to_cell_pin=to_pin,
+                    delay=single_delay,
+                    delay_paths=delay_paths,
+                    is_timing_check=component_data["is_timing_check"],
+                    is_timing_env=component_data["is_timing_env"],
+                    is_absolute=component_data["is_absolute"],
+                    is_incremental=component_data["is_incremental"],
+                    is_cond=component_data["is_cond"],
+                    cond_equation=component_data["cond_equation"],
+                    from_pin_edge=component_data["from_pin_edge"],
+                    to_pin_edge=component_data["to_pin_edge"],
+                )
+                instances[instance_name].append(instance_component)
+
+                # IOPATH is a combinational path that can change the output
+                # of a cell based on changes to the input. Component is frozen,
+                # so the graph shares the instance's object.
+                if c_type == "iopath":
+                    io_paths.append(instance_component)
 
                 # Since SDF does not model for a FF a path from D -> Q as IOPATH
                 # only CLK -> Q is IOPATH, since the D -> Q path is not combinational
                 # but sequential. Swap pins and model D --(delay 0)--> CLK --> Q
                 # beacuse CLK always controls the output Q.
-                if component_data["type"] in ("setup", "hold"):
+                elif c_type in ("setup", "hold"):
                     io_paths.append(
                         Component(
                             c_type=SDFCellType.IOPATH,
@@ -204,11 +247,10 @@ def parse_sdf(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
                             connection_string=str(component).split("_", 1)[-1],
                             from_cell_instance=instance_name,
                             to_cell_instance=instance_name,
-                            from_cell_pin=component_data["to_pin"],
-                            to_cell_pin=component_data["from_pin"],
+                            from_cell_pin=to_pin,
+                            to_cell_pin=from_pin,
                             delay=0.0,
                             delay_paths=None,
-                            is_one_cell_instance=True,
                             is_timing_check=component_data["is_timing_check"],
                             is_timing_env=component_data["is_timing_env"],
                             is_absolute=component_data["is_absolute"],
@@ -220,58 +262,6 @@ def parse_sdf(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
                         )
                     )
 
-                # INTERCONNECT is a path that connects two different cell instances,
-                # which can be combinational or sequential.
-                if component_data["type"] == "interconnect":
-                    interconnects.append(
-                        Component(
-                            c_type=SDFCellType.INTERCONNECT,
-                            cell_name=cell_name,
-                            connection_string=component,
-                            from_cell_instance=inst_pin_from[0],
-                            to_cell_instance=inst_pin_to[0],
-                            from_cell_pin=inst_pin_from[1],
-                            to_cell_pin=inst_pin_to[1],
-                            delay=single_delay,
-                            delay_paths=component_data["delay_paths"],
-                            is_one_cell_instance=one_inst,
-                            is_timing_check=component_data["is_timing_check"],
-                            is_timing_env=component_data["is_timing_env"],
-                            is_absolute=component_data["is_absolute"],
-                            is_incremental=component_data["is_incremental"],
-                            is_cond=component_data["is_cond"],
-                            cond_equation=component_data["cond_equation"],
-                            from_pin_edge=component_data["from_pin_edge"],
-                            to_pin_edge=component_data["to_pin_edge"],
-                        )
-                    )
-
-                # Other components include timing checks (hold, setup, reset,
-                # recover, width) and other types of paths.
-                if component_data["type"] != "interconnect":
-                    instances[instance_name].append(
-                        Component(
-                            c_type=SDFCellType(component_data["type"].upper()),
-                            cell_name=cell_name,
-                            connection_string=component,
-                            from_cell_instance=instance_name,
-                            to_cell_instance=instance_name,
-                            from_cell_pin=component_data["from_pin"],
-                            to_cell_pin=component_data["to_pin"],
-                            delay=single_delay,
-                            delay_paths=component_data["delay_paths"],
-                            is_one_cell_instance=True,
-                            is_timing_check=component_data["is_timing_check"],
-                            is_timing_env=component_data["is_timing_env"],
-                            is_absolute=component_data["is_absolute"],
-                            is_incremental=component_data["is_incremental"],
-                            is_cond=component_data["is_cond"],
-                            cond_equation=component_data["cond_equation"],
-                            from_pin_edge=component_data["from_pin_edge"],
-                            to_pin_edge=component_data["to_pin_edge"],
-                        )
-                    )
-
     # io_paths, interconnects, header_info, sdf_data, cells, instances
     return SDFGobject(
         nx_graph=nx.DiGraph(),
@@ -285,7 +275,9 @@ def parse_sdf(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
     )
 
 
-def gen_timing_digraph(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
+def gen_timing_digraph(
+    sdf_file: Path, delay_type_str: DelayType, *, sdf_text: str | None = None
+) -> SDFGobject:
     """Generate a timing directed networkx graph (DiGraph) from the SDF file.
 
     Also extracts header information, cell names, and instance-component mappings. But
@@ -299,6 +291,9 @@ def gen_timing_digraph(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
         Path to the SDF file.
     delay_type_str : DelayType
         The type of delay to extract (e.g., DelayType.MAX_ALL).
+    sdf_text : str | None, optional
+        Content of `sdf_file` if the caller has already read it, so the file
+        is not read a second time.
 
     Returns
     -------
@@ -307,23 +302,29 @@ def gen_timing_digraph(sdf_file: Path, delay_type_str: DelayType) -> SDFGobject:
         cell names, instance-component mappings, and lists of IOPATH
         and INTERCONNECT components.
     """
-    sdf_gobject: SDFGobject = parse_sdf(sdf_file, delay_type_str)
+    sdf_gobject: SDFGobject = parse_sdf(sdf_file, delay_type_str, sdf_text=sdf_text)
 
+    # Every pin is the endpoint of several edges (fan-out and fan-in), so each
+    # node name is built once and the same interned string is reused.
+    @cache
     def node(inst: str, pin: str) -> str:
         """Create a node name from instance and pin.
 
         It uses the hierarchical separator.
         """
-        return f"{inst}{sdf_gobject.hier_sep}{pin}".removeprefix(sdf_gobject.hier_sep)
+        return sys.intern(
+            f"{inst}{sdf_gobject.hier_sep}{pin}".removeprefix(sdf_gobject.hier_sep)
+        )
 
     # Includes both IOPATHs and INTERCONNECTS, but not timing checks
-    # or other components.
-    components: list[Component] = sdf_gobject.io_paths + sdf_gobject.interconnects
-    for comp in components:
-        sdf_gobject.nx_graph.add_edge(
+    # or other components. Edges are added in one bulk call, a later
+    # component on the same edge still overwrites the earlier one.
+    sdf_gobject.nx_graph.add_edges_from(
+        (
             node(comp.from_cell_instance, comp.from_cell_pin),
             node(comp.to_cell_instance, comp.to_cell_pin),
-            weight=comp.delay,
-            component=comp,
+            {"weight": comp.delay, "component": comp},
         )
+        for comp in chain(sdf_gobject.io_paths, sdf_gobject.interconnects)
+    )
     return sdf_gobject
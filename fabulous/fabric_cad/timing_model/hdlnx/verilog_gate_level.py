@@ -6,15 +6,110 @@ generate the SDF file from the Verilog netlist.
 """
 
 import re
+import sys
+from collections.abc import Iterator
+from functools import cached_property
+from itertools import chain
 
 import networkx as nx
 
 from fabulous.fabric_cad.timing_model.hdlnx.sdfnx.sdf_to_graph import SDFTimingGraph
 from fabulous.fabric_cad.timing_model.models import (
     DelayType,
+    VerilogInstance,
 )
 from fabulous.fabric_cad.timing_model.tools.specification import StaTool
 
+# Block /* ... */ and line // ... comments in one alternation, so the netlist is
+# scanned once and a "/*" inside a line comment does not open a block comment.
+_COMMENT_PATTERN = re.compile(r"/\*.*?\*/|//[^\n]*", flags=re.DOTALL)
+
+# Regex for module declaration: module <name> [#(...)] (
+_MODULE_DECL_PATTERN = re.compile(
+    r"^\s*module\s+([A-Za-z_]\w*)\s*"  # module name (group 1)
+    r"(?:#\s*\([^()]*\))?"  # optional parameter list #(...)
+    r"\s*\(",  # opening parenthesis of port list
+    flags=re.MULTILINE,
+)
+
+# Only the module header is matched by regex; the body is sliced up to the next
+# "endmodule" with str.find, which is far faster than a lazy DOTALL match.
+_MODULE_HEADER_PATTERN = re.compile(r"\bmodule\b\s+([A-Za-z_][\w$]*)\b")
+
+# Very simple instance pattern for the text of one statement, without its ";":
+# CellType inst_name ( .PIN(net), ... )
+# It is searched rather than anchored, so an escaped type like "\$_NAND_" still
+# yields the plain "_NAND_".
+_INST_PATTERN = re.compile(
+    r"([A-Za-z_][\w$]*)\s+([A-Za-z_][\w$]*)\s*\((.*)\)\Z", flags=re.DOTALL
+)
+
+# The net is taken greedily up to ")" and stripped afterwards; a lazy match with
+# surrounding \s* backtracks on every pin of wide cells.
+_PIN_NET_PATTERN = re.compile(r"\.\s*([\w$]+)\s*\(([^)]+)\)")
+
+_RESERVED_TYPES = frozenset(
+    {
+        "module",
+        "input",
+        "output",
+        "inout",
+        "wire",
+        "reg",
+        "tri",
+        "tri0",
+        "tri1",
+        "supply0",
+        "supply1",
+        "parameter",
+        "localparam",
+        "assign",
+        "always",
+        "initial",
+        "generate",
+        "endgenerate",
+        "if",
+        "for",
+        "case",
+        "function",
+        "task",
+    }
+)
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether `char` counts as a word character for regex word boundaries."""
+    return char.isalnum() or char == "_"
+
+
+def _iter_module_bodies(src: str) -> Iterator[tuple[str, str]]:
+    """Split Verilog source into its modules.
+
+    Parameters
+    ----------
+    src : str
+        Verilog source without comments.
+
+    Yields
+    ------
+    tuple[str, str]
+        The module name and the text between its header name and `endmodule`.
+    """
+    pos = 0
+    while (m := _MODULE_HEADER_PATTERN.search(src, pos)) is not None:
+        end = m.end()
+        # Skip identifiers that merely contain "endmodule"
+        while (end := src.find("endmodule", end)) >= 0:
+            if not (
+                _is_word_char(src[end - 1]) or _is_word_char(src[end + 9 : end + 10])
+            ):
+                break
+            end += 1
+        if end < 0:
+            return
+        yield m.group(1), src[m.end() : end]
+        pos = end + len("endmodule")
+
 
 class VerilogGateLevelTimingGraph(SDFTimingGraph):
     """Class to represent a timing graph from a Verilog gate-level netlist.
@@ -51,10 +146,14 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         self.delay_type_str: DelayType = delay_type_str
         self.debug: bool = debug
         self.sta_tool: StaTool = sta_tool
+        self._resolved_pin_cache: dict[str, list[str]] = {}
 
         self.sta_tool.sta_analyze()
-        super().__init__(self.sta_tool.sta_sdf_file, self.delay_type_str)
-        self.sta_tool.sta_clean_up()
+        # Remove the temporary SDF even if parsing it fails.
+        try:
+            super().__init__(self.sta_tool.sta_sdf_file, self.delay_type_str)
+        finally:
+            self.sta_tool.sta_clean_up()
 
     ### Public methods ###
 
@@ -68,6 +167,171 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         """
         return self.verilog_netlist_content
 
+    def _strip_netlist_comments(self) -> str:
+        """Return the Verilog netlist content with all comments stripped.
+
+        Not cached: a second full copy of a large netlist would live as long as
+        the model, while only the one-off parse and module lookup need it.
+
+        Returns
+        -------
+        str
+            The netlist content without block and line comments.
+        """
+        return _COMMENT_PATTERN.sub("", self.verilog_netlist_content)
+
+    @cached_property
+    def _netlist_modules(self) -> dict[str, dict[str, VerilogInstance]]:
+        """Parse the netlist into its modules and their instances.
+
+        The netlist does not change after construction, so the regex sweep runs
+        once and every hierarchy query reuses the result.
+
+        Returns
+        -------
+        dict[str, dict[str, VerilogInstance]]
+            Mapping from module name to its instances, keyed by instance name in
+            instantiation order.
+        """
+        modules: dict[str, dict[str, VerilogInstance]] = {}
+        for mod_name, mod_body in _iter_module_bodies(self._strip_netlist_comments()):
+            instances: dict[str, VerilogInstance] = {}
+            for stmt in mod_body.split(";"):
+                stmt = stmt.lstrip()
+                # Declarations and other keyword statements far outnumber the
+                # instances, so drop them before running the regex.
+                if stmt.partition(" ")[0] in _RESERVED_TYPES:
+                    continue
+                im = _INST_PATTERN.search(stmt)
+                if im is None:
+                    continue
+                cell_type, inst_name, conn_str = im.groups()
+
+                # Skip "instances" that are actually keywords
+                if cell_type in _RESERVED_TYPES:
+                    continue
+
+                # Names are interned: the same nets, pins and cell types repeat
+                # across thousands of instances and are compared in traversals.
+                conns = {
+                    sys.intern(pin): sys.intern(net.strip())
+                    for pin, net in _PIN_NET_PATTERN.findall(conn_str)
+                }
+                inst_name = sys.intern(inst_name)
+                instances.setdefault(
+                    inst_name, VerilogInstance(sys.intern(cell_type), inst_name, conns)
+                )
+
+            modules[sys.intern(mod_name)] = instances
+        return modules
+
+    @cached_property
+    def _netlist_net_fanout(self) -> dict[tuple[str, str], list[tuple[str, str, str]]]:
+        """Index every instance pin of the netlist by the net it connects to.
+
+        Returns
+        -------
+        dict[tuple[str, str], list[tuple[str, str, str]]]
+            Mapping from (module name, net name) to the (instance name, pin name,
+            instance type) triples on that net, in instantiation order.
+        """
+        fanout: dict[tuple[str, str], list[tuple[str, str, str]]] = {}
+        for mod_name, instances in self._netlist_modules.items():
+            for inst in instances.values():
+                for pin, net in inst.conns.items():
+                    fanout.setdefault((mod_name, net), []).append(
+                        (inst.name, pin, inst.cell_type)
+                    )
+        return fanout
+
+    def _build_netlist_index(self) -> None:
+        """Parse the netlist and build its net fan-out index ahead of queries."""
+        _ = self._netlist_net_fanout
+
+    @cached_property
+    def _input_port_set(self) -> frozenset[str]:
+        """Top-level input ports as a set, for constant-time membership tests.
+
+        Returns
+        -------
+        frozenset[str]
+            The names in `input_ports`.
+        """
+        return frozenset(self.input_ports)
+
+    @cached_property
+    def _output_port_set(self) -> frozenset[str]:
+        """Top-level output ports as a set, for constant-time membership tests.
+
+        Returns
+        -------
+        frozenset[str]
+            The names in `output_ports`.
+        """
+        return frozenset(self.output_ports)
+
+    @cached_property
+    def _nearest_output_port(self) -> dict[str, str]:
+        """Nearest output port of every node, searched once for all pins.
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping from node to the nearest output port it reaches.
+        """
+        return self.nearest_target_map(self.output_ports)
+
+    @cached_property
+    def _nearest_input_port(self) -> dict[str, str]:
+        """Nearest input port of every node, searched once for all pins.
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping from node to the nearest input port that reaches it.
+        """
+        return self.nearest_target_map(self.input_ports, reverse=True)
+
+    def _find_instance(self, hier_inst_path: str) -> VerilogInstance:
+        """Walk the hierarchy from the top module down to an instance.
+
+        Parameters
+        ----------
+        hier_inst_path : str
+            Hierarchical instance path, without the top module name.
+
+        Returns
+        -------
+        VerilogInstance
+            The instance at the end of the path.
+
+        Raises
+        ------
+        ValueError
+            If the top module, an intermediate module or an instance is not found
+            in the netlist.
+        """
+        modules = self._netlist_modules
+        current_module = self.top_name
+        if current_module not in modules:
+            raise ValueError(f"Top module {current_module!r} not found in netlist")
+
+        for inst_name in hier_inst_path.split(self.hier_sep):
+            instances = modules.get(current_module)
+            if instances is None:
+                raise ValueError(
+                    f"Module {current_module!r} not found while "
+                    f"resolving {hier_inst_path!r}"
+                )
+            instance = instances.get(inst_name)
+            if instance is None:
+                raise ValueError(
+                    f"Instance {inst_name!r} not found inside module {current_module!r}"
+                )
+            # Descend into the instance's module type for the next segment
+            current_module = instance.cell_type
+        return instance
+
     def resolve_hier_pin(self, hier_pin_path: str) -> list[str]:
         """Resolve hierarchical pin path to leaf pins.
 
@@ -101,86 +365,16 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         - Ignores assign statements, generate blocks, functions, etc.
         - Assumes module port names are used as net names inside the module.
         """
+        # The netlist is immutable after construction, so resolved pins are kept.
+        # Callers get a copy so they cannot alter the cached result.
+        cache_key = hier_pin_path
+        cached = self._resolved_pin_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+
         sep = self.hier_sep
         hier_pin_path: str = f"{self.top_name}{sep}{hier_pin_path}"
-        verilog_src: str = self.verilog_netlist_content
-
-        # ------------------------------------------------------------------
-        # Strip comments: /* ... */ and // ...
-        # ------------------------------------------------------------------
-        src_no_block = re.sub(r"/\*.*?\*/", "", verilog_src, flags=re.DOTALL)
-        src_clean = re.sub(r"//.*?$", "", src_no_block, flags=re.MULTILINE)
-
-        # ------------------------------------------------------------------
-        # Parse modules and their instances (type + name + pin connections)
-        # ------------------------------------------------------------------
-        modules = {}
-
-        module_pattern = re.compile(
-            r"\bmodule\b\s+([A-Za-z_][\w$]*)\b(.*?)\bendmodule\b", flags=re.DOTALL
-        )
-
-        # Very simple instance pattern: CellType inst_name ( .PIN(net), ... );
-        # This will also match the module header "module name (...);"
-        # but we filter it out.
-        inst_pattern = re.compile(
-            r"([A-Za-z_][\w$]*)\s+([A-Za-z_][\w$]*)\s*\((.*?)\);\s*", flags=re.DOTALL
-        )
-
-        reserved_types = {
-            "module",
-            "input",
-            "output",
-            "inout",
-            "wire",
-            "reg",
-            "tri",
-            "tri0",
-            "tri1",
-            "supply0",
-            "supply1",
-            "parameter",
-            "localparam",
-            "assign",
-            "always",
-            "initial",
-            "generate",
-            "endgenerate",
-            "if",
-            "for",
-            "case",
-            "function",
-            "task",
-        }
-
-        pin_net_pattern = re.compile(r"\.\s*([\w$]+)\s*\(\s*([^)]+?)\s*\)")
-
-        for m in module_pattern.finditer(src_clean):
-            mod_name = m.group(1)
-            mod_body = m.group(2)
-            instances = []
-
-            for im in inst_pattern.finditer(mod_body):
-                cell_type, inst_name, conn_str = im.groups()
-
-                # Skip "instances" that are actually keywords, e.g. the module header
-                if cell_type in reserved_types:
-                    continue
-
-                conns = {}
-                for pin, net in pin_net_pattern.findall(conn_str):
-                    net = net.strip()
-                    conns[pin] = net
-
-                instances.append(
-                    {
-                        "type": cell_type,
-                        "name": inst_name,
-                        "conns": conns,
-                    }
-                )
-
-            modules[mod_name] = {"instances": instances}
+        modules = self._netlist_modules
 
         # ------------------------------------------------------------------
         # Parse hierarchical pin path: Top/inst1/inst2/.../pin
@@ -212,17 +406,12 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
 
         for inst_name in inst_chain:
             prev_module = curr_module
-            inst_list = modules.get(curr_module, {}).get("instances", [])
-            last_inst = None
-            for inst in inst_list:
-                if inst["name"] == inst_name:
-                    last_inst = inst
-                    break
+            last_inst = modules.get(curr_module, {}).get(inst_name)
             if last_inst is None:
                 raise KeyError(
                     f"Instance {inst_name!r} not found in module {curr_module!r}"
                 )
-            curr_module = last_inst["type"]
+            curr_module = last_inst.cell_type
             hier_prefix += f"{sep}" + inst_name
 
         if last_inst is None or prev_module is None:
@@ -231,9 +420,9 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
             )
 
         # last_inst is the instance whose pin we are addressing
-        if target_pin not in last_inst["conns"]:
+        if target_pin not in last_inst.conns:
             raise KeyError(
-                f"Pin {target_pin!r} not found on instance {last_inst['name']!r} "
+                f"Pin {target_pin!r} not found on instance {last_inst.name!r} "
                 f"in module {prev_module!r}"
             )
 
@@ -246,55 +435,48 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
             prefix = top_module + f"{sep}"
             # strip top module name from hierarchical prefix
             pp = hier_prefix.removeprefix(prefix)
-            return [f"{pp}{sep}{target_pin}"]
+            self._resolved_pin_cache[cache_key] = [f"{pp}{sep}{target_pin}"]
+            return self._resolved_pin_cache[cache_key].copy()
 
         # ------------------------------------------------------------------
-        # Recursively traverse down the hierarchy from (child_module, child_net)
+        # Walk down the hierarchy from (child_module, child_net) with an explicit
+        # stack, so deep hierarchies do not hit the recursion limit. Each entry is
+        # (module type, net inside it or std-cell pin, hierarchical prefix).
+        # Entries are pushed in reverse so leaf pins come out in instantiation
+        # order.
         # ------------------------------------------------------------------
+        net_fanout = self._netlist_net_fanout
         visited = set()
+        leaf_pins = []
+        stack = [(child_module, child_net, hier_prefix)]
+        while stack:
+            mod_name, net_name, prefix = stack.pop()
+
+            # Leaf std-cell: no module definition for its type
+            if mod_name not in modules:
+                leaf_pins.append(f"{prefix}{sep}{net_name}")
+                continue
 
-        def traverse(mod_name: str, net_name: str, prefix: str) -> list[str]:
-            """Traverse down the hierarchy from (mod_name, net_name) with prefix.
-
-            In module `mod_name`, find all instance pins that are connected to
-            `net_name`.
-
-            For std-cell instances (type not in modules), record leaf paths. For
-            submodules (type in modules), recurse into that submodule, using the pin
-            name as the net name inside the child.
-            """
             key = (mod_name, net_name, prefix)
             if key in visited:
-                return []
+                continue
             visited.add(key)
 
-            results = []
-            inst_list = modules.get(mod_name, {}).get("instances", [])
-
-            for inst in inst_list:
-                inst_type = inst["type"]
-                inst_name = inst["name"]
-                for pin, net in inst["conns"].items():
-                    if net != net_name:
-                        continue
-
-                    new_prefix = f"{prefix}{sep}{inst_name}"
-
-                    # Leaf std-cell: no module definition for its type
-                    if inst_type not in modules:
-                        results.append(f"{new_prefix}{sep}{pin}")
-                    else:
-                        # Submodule: descend, assuming port name == internal net name
-                        results.extend(traverse(inst_type, pin, new_prefix))
-
-            return results
-
-        leaf_pins = traverse(child_module, child_net, hier_prefix)
+            # Submodule: descend, assuming port name == internal net name
+            stack.extend(
+                (inst_type, pin, f"{prefix}{sep}{inst_name}")
+                for inst_name, pin, inst_type in reversed(
+                    net_fanout.get((mod_name, net_name), ())
+                )
+            )
 
         # strip top module name
         prefix = top_module + f"{sep}"
 
-        return [p.removeprefix(prefix) for p in leaf_pins]
+        self._resolved_pin_cache[cache_key] = [
+            p.removeprefix(prefix) for p in leaf_pins
+        ]
+        return self._resolved_pin_cache[cache_key].copy()
 
     def find_verilog_modules_regex(self, name_pattern: str) -> list[str]:
         """Find Verilog module names matching a regex pattern.
@@ -312,29 +494,51 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         list[str]
             List of module names matching the regex pattern.
         """
-        verilog_src: str = self.verilog_netlist_content
-
-        # Strip block and line comments
-        src = re.sub(r"/\*.*?\*/", "", verilog_src, flags=re.DOTALL)  # /* ... */
-        src = re.sub(r"//.*?$", "", src, flags=re.MULTILINE)  # // ...
-
-        #    Regex for module declaration:
-        #    module <name> [#(...)] (
-        module_decl_re = re.compile(
-            r"^\s*module\s+([A-Za-z_]\w*)\s*"  # module name (group 1)
-            r"(?:#\s*\([^()]*\))?"  # optional parameter list #(...)
-            r"\s*\(",  # opening parenthesis of port list
-            flags=re.MULTILINE,
-        )
-
         name_re = re.compile(name_pattern)
         found: list[str] = []
-        for m in module_decl_re.finditer(src):
+        for m in _MODULE_DECL_PATTERN.finditer(self._strip_netlist_comments()):
             name = m.group(1)
             if name_re.search(name):
                 found.append(name)
         return found
 
+    def _iter_instance_paths(self) -> Iterator[tuple[VerilogInstance, str]]:
+        """Walk the hierarchy from the top module depth-first.
+
+        Uses an explicit stack of (instance, parent path) so deep hierarchies do
+        not hit the recursion limit. Children are pushed in reverse to keep the
+        instantiation order of a recursive walk.
+
+        Yields
+        ------
+        tuple[VerilogInstance, str]
+            Each instance together with its hierarchical path, without the top
+            module name.
+
+        Raises
+        ------
+        KeyError
+            If the top module specified by `top_name` is not found in the netlist.
+        """
+        top_module = self.top_name
+        sep = self.hier_sep
+        modules = self._netlist_modules
+        if top_module not in modules:
+            raise KeyError(f"Top module {top_module!r} not found in netlist")
+
+        stack = [(inst, "") for inst in reversed(modules[top_module].values())]
+        while stack:
+            inst, parent_path = stack.pop()
+            hier_path = f"{parent_path}{sep}{inst.name}" if parent_path else inst.name
+            yield inst, hier_path
+
+            # If this instance's type is another module, descend into it
+            children = modules.get(inst.cell_type)
+            if children is not None:
+                stack.extend(
+                    (child, hier_path) for child in reversed(children.values())
+                )
+
     def find_instance_paths_by_regex(
         self, inst_regex: str, filter_regex: str | None = None
     ) -> list[str]:
@@ -343,6 +547,7 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         Parse a structural Verilog netlist, walk the hierarchy from `top_module`, and
         return all hierarchical instance paths (without the top module name) whose path
         matches `inst_regex`.
+        The walk raises KeyError if the top module is not found in the netlist.
 
         Parameters
         ----------
@@ -355,127 +560,15 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         -------
         list[str]
             List of hierarchical instance paths matching the regex.
-
-        Raises
-        ------
-        KeyError
-            If the top module specified by `top_name` is not found in the netlist.
         """
-        top_module = self.top_name
-        sep = self.hier_sep
-        verilog_src: str = self.verilog_netlist_content
-
-        # -------------------------------------------------------------
-        # Remove comments: /* ... */ and // ...
-        # -------------------------------------------------------------
-        src_no_block = re.sub(r"/\*.*?\*/", "", verilog_src, flags=re.DOTALL)
-        src_clean = re.sub(r"//.*?$", "", src_no_block, flags=re.MULTILINE)
-
-        # -------------------------------------------------------------
-        # Parse modules and their instances (type + name only)
-        # -------------------------------------------------------------
-        modules = {}
-
-        module_pattern = re.compile(
-            r"\bmodule\b\s+([A-Za-z_][\w$]*)\b(.*?)\bendmodule\b",
-            flags=re.DOTALL,
-        )
-
-        # Simple instance pattern: CellType inst_name ( ... );
-        inst_pattern = re.compile(
-            r"([A-Za-z_][\w$]*)\s+([A-Za-z_][\w$]*)\s*\(",
-            flags=re.DOTALL,
-        )
-
-        reserved_types = {
-            "module",
-            "input",
-            "output",
-            "inout",
-            "wire",
-            "reg",
-            "tri",
-            "tri0",
-            "tri1",
-            "supply0",
-            "supply1",
-            "parameter",
-            "localparam",
-            "assign",
-            "always",
-            "initial",
-            "generate",
-            "endgenerate",
-            "if",
-            "for",
-            "case",
-            "function",
-            "task",
-        }
-
-        for m in module_pattern.finditer(src_clean):
-            mod_name = m.group(1)
-            mod_body = m.group(2)
-            instances = []
-
-            for im in inst_pattern.finditer(mod_body):
-                cell_type, inst_name = im.groups()
-
-                # Skip things that look like keywords / non-instances
-                if cell_type in reserved_types:
-                    continue
-
-                instances.append(
-                    {
-                        "type": cell_type,
-                        "name": inst_name,
-                    }
-                )
-
-            modules[mod_name] = {"instances": instances}
-
-        # -------------------------------------------------------------
-        # Check that top_module exists
-        # -------------------------------------------------------------
-        if top_module not in modules:
-            raise KeyError(f"Top module {top_module!r} not found in netlist")
-
-        # -------------------------------------------------------------
-        # DFS from top_module, build hierarchical instance paths
-        # (without including the top module name itself)
-        # -------------------------------------------------------------
         pattern = re.compile(inst_regex)
-        results = []
-
-        def dfs(mod_name: str, path_parts: list[str]) -> None:
-            """Depth-first search to build hierarchical instance paths.
-
-            mod_name: current module type.
-            path_parts: list of instance names from *below* top, e.g.
-            ["inst_sw_matrix", "inst_cus_mux81_buf_NN4BEG0"]
-            """
-            inst_list = modules.get(mod_name, {}).get("instances", [])
-            for inst in inst_list:
-                inst_name = inst["name"]
-                new_parts = path_parts + [inst_name]
-                hier_path = sep.join(new_parts)  # WITHOUT the top module name
-
-                # Regex is matched on this hierarchical path
-                if pattern.search(hier_path):
-                    results.append(hier_path)
-
-                # If this instance's type is another module, recurse into it
-                inst_type = inst["type"]
-                if inst_type in modules:
-                    dfs(inst_type, new_parts)
-
-        dfs(top_module, [])
-
-        if filter_regex is not None:
-            filter_pattern = re.compile(filter_regex)
-            results = [p for p in results if filter_pattern.search(p)]
-
-        return results
+        filter_pattern = re.compile(filter_regex) if filter_regex is not None else None
+        return [
+            hier_path
+            for _, hier_path in self._iter_instance_paths()
+            if pattern.search(hier_path)
+            and (filter_pattern is None or filter_pattern.search(hier_path))
+        ]
 
     def find_instances_with_all_nets(
         self, module_name: str, nets: list[str]
@@ -511,53 +604,27 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         ValueError
             If the specified module is not found in the netlist.
         """
-        text = self.verilog_netlist_content
-
-        # Extract the reference module body: module <name> ... endmodule
-        mod_pattern = re.compile(
-            rf"module\s+{re.escape(module_name)}\b(.*?endmodule)", re.DOTALL
-        )
-        m = mod_pattern.search(text)
-        if not m:
+        instances = self._netlist_modules.get(module_name)
+        if instances is None:
             raise ValueError(f"Module {module_name!r} not found in netlist content")
-
-        module_body = m.group(1)
-
-        # Remove simple // comments to avoid bogus matches
-        module_body = re.sub(r"//.*?$", "", module_body, flags=re.MULTILINE)
-
-        # Find instantiations:  cell_type inst_name ( ... );
-        inst_pattern = re.compile(
-            r"""
-            (?P<cell>\w+)        # cell type
-            \s+
-            (?P<inst>\w+)        # instance name
-            \s*
-            \(
-                (?P<pins>[^;]*?) # pin connections until the semicolon
-            \)
-            \s*;
-            """,
-            re.DOTALL | re.VERBOSE,
-        )
-
-        # Pin connection pattern: .PIN_NAME(NET_NAME)
-        pin_conn_pattern = re.compile(r"\.\s*\w+\s*\(\s*([^\s\)]+)\s*\)")
-
-        target_nets = set(nets)
-        matching_instances: list[str] = []
-
-        for im in inst_pattern.finditer(module_body):
-            inst_name = im.group("inst")
-            pins_block = im.group("pins")
-
-            # Collect all nets connected on this instance
-            nets_on_inst = set(pin_conn_pattern.findall(pins_block))
-
-            if target_nets.issubset(nets_on_inst):
-                matching_instances.append(inst_name)
-
-        return matching_instances
+        if not nets:
+            return list(instances)
+
+        # Intersect the instances on each net instead of scanning every instance.
+        # The fan-out lists are in instantiation order, so the result is too.
+        net_fanout = self._netlist_net_fanout
+        insts_per_net = [
+            dict.fromkeys(
+                inst_name for inst_name, _, _ in net_fanout.get((module_name, net), ())
+            )
+            for net in set(nets)
+        ]
+        fewest = min(insts_per_net, key=len)
+        return [
+            inst_name
+            for inst_name in fewest
+            if all(inst_name in insts for insts in insts_per_net)
+        ]
 
     def find_instances_paths_with_all_nets(
         self, module_name: str, nets: list[str], filter_regex: str | None = None
@@ -583,14 +650,21 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         list[str]
             List of hierarchical instance paths (strings).
         """
-        inst_hier_paths = []
-        insts = self.find_instances_with_all_nets(module_name, nets)
-        for inst in insts:
-            paths = self.find_instance_paths_by_regex(
-                rf"{re.escape(inst)}$", filter_regex=filter_regex
-            )
-            inst_hier_paths.extend(paths)
-        return inst_hier_paths
+        # One hierarchy walk for all instances instead of one regex walk each
+        paths_by_inst: dict[str, list[str]] = {
+            inst: [] for inst in self.find_instances_with_all_nets(module_name, nets)
+        }
+        for inst, hier_path in self._iter_instance_paths():
+            if inst.name in paths_by_inst:
+                paths_by_inst[inst.name].append(hier_path)
+
+        filter_pattern = re.compile(filter_regex) if filter_regex is not None else None
+        return [
+            path
+            for paths in paths_by_inst.values()
+            for path in paths
+            if filter_pattern is None or filter_pattern.search(path)
+        ]
 
     def net_to_pin_paths_for_instance(self, hier_inst_path: str) -> dict[str, str]:
         """Paths from nets to hierarchical pins for an instance.
@@ -601,7 +675,9 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         and a gate-level Verilog netlist, return a mapping:
             net_name -> "hier_inst_path/pin_name"
 
-        Only the leaf instance is resolved (no further hierarchy).
+        Only the leaf instance is resolved (no further hierarchy). The instance is
+        looked up with `_find_instance`, which raises ValueError if the top module
+        or an instance on the path is not found in the netlist.
 
         Example output:
             {
@@ -619,96 +695,13 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         -------
         dict[str, str]
             Mapping from net names to pins keep hierarchy (no further hierarchy).
-
-        Raises
-        ------
-        ValueError
-            If the top module or instance is not found in the netlist.
-        RuntimeError
-            If an unexpected error occurs during hierarchy resolution.
         """
-        text = self.verilog_netlist_content
-        top_module = self.top_name
         sep = self.hier_sep
-
-        # Collect all modules: name -> body text
-        module_pattern = re.compile(
-            r"module\s+(\w+)\b(.*?endmodule)",
-            re.DOTALL,
-        )
-
-        modules = {}
-        for m in module_pattern.finditer(text):
-            name = m.group(1)
-            body = m.group(2)
-            modules[name] = body
-
-        if top_module not in modules:
-            raise ValueError(f"Top module {top_module!r} not found in netlist")
-
-        # Pattern for instances inside a module
-        # Handles: cell_type [#(...)] inst_name ( ... );
-        inst_pattern = re.compile(
-            r"""
-            (?P<cell>\w+)                 # cell/module type
-            \s+
-            (?P<inst>\w+)                 # instance name
-            \s*
-            \(
-                (?P<pins>[^;]*?)          # pin connections until ';'
-            \)
-            \s*;
-            """,
-            re.DOTALL | re.VERBOSE,
-        )
-
-        # Pattern for pin connections: .PIN(NET)
-        pin_conn_pattern = re.compile(
-            r"\.\s*(?P<pin>\w+)\s*\(\s*(?P<net>[^\s\)]+)\s*\)"
-        )
-
-        # Walk the hierarchy down to the leaf instance
-        segments = hier_inst_path.split(sep)
-        current_module = top_module
-
-        for depth, inst_name in enumerate(segments):
-            body = modules.get(current_module)
-            if body is None:
-                raise ValueError(
-                    f"Module {current_module!r} not found while "
-                    f"resolving {hier_inst_path!r}"
-                )
-
-            found = False
-            cell_type = None
-            pins_block = None
-
-            for m in inst_pattern.finditer(body):
-                if m.group("inst") == inst_name:
-                    cell_type = m.group("cell")
-                    pins_block = m.group("pins")
-                    found = True
-                    break
-
-            if not found:
-                raise ValueError(
-                    f"Instance {inst_name!r} not found inside module {current_module!r}"
-                )
-
-            # If not yet at the leaf, descend into the instance's module type
-            if depth < len(segments) - 1:
-                current_module = cell_type
-            else:
-                # Leaf instance: parse its pin connections
-                net_to_path: dict[str, str] = {}
-                for pm in pin_conn_pattern.finditer(pins_block):
-                    pin = pm.group("pin")
-                    net = pm.group("net")
-                    # Note: if the same net appears on multiple pins, last one wins
-                    net_to_path[net] = f"{hier_inst_path}{sep}{pin}"
-                return net_to_path
-
-        raise RuntimeError("Unexpected end of hierarchy resolution")
+        # Note: if the same net appears on multiple pins, last one wins
+        return {
+            net: f"{hier_inst_path}{sep}{pin}"
+            for pin, net in self._find_instance(hier_inst_path).conns.items()
+        }
 
     def net_to_pin_paths_for_instance_resolved(
         self, hier_inst_path: str
@@ -767,37 +760,36 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         ------
         ValueError
             If num_ports is less than 1.
+        nx.NodeNotFound
+            If `hier_pin_path` is not in the graph.
         """
-        # Use NetworkX shortest path to find nearest port
-        # Depending on `reverse`, search towards inputs or outputs
+        # The single nearest port comes from a map built by one multi-source
+        # search from all ports. Depending on `reverse`, search towards inputs
+        # or outputs
         # If reverse=True, search towards inputs (for setup analysis)
         # If reverse=False, search towards outputs (for hold analysis)
 
         if num_ports < 1:
             raise ValueError("num_ports must be at least 1")
+        G = self.reverse_graph if reverse else self.graph
+        if hier_pin_path not in G:
+            raise nx.NodeNotFound(f"Source {hier_pin_path} is not in G")
         if num_ports == 1:
-            path_without_sentinel, closest_target = (
-                self.path_to_nearest_target_sentinel(
-                    hier_pin_path,
-                    self.input_ports if reverse else self.output_ports,
-                    reverse=reverse,
-                )
-            )
-            return [closest_target] if closest_target is not None else []
-        if reverse:
-            dist = nx.single_source_shortest_path_length(
-                self.reverse_graph, hier_pin_path
-            )
-            leaf_dists = [(v, d) for v, d in dist.items() if v in self.input_ports]
-        else:
-            dist = nx.single_source_shortest_path_length(self.graph, hier_pin_path)
-            leaf_dists = [(v, d) for v, d in dist.items() if v in self.output_ports]
-
-        if len(leaf_dists) == 0:
-            return []
+            nearest = self._nearest_input_port if reverse else self._nearest_output_port
+            return [nearest[hier_pin_path]] if hier_pin_path in nearest else []
 
-        # already sorted by distance from NetworkX
-        return [leaf_dists[i][0] for i in range(min(num_ports, len(leaf_dists)))]
+        # Ports in breadth-first discovery order, i.e. sorted by distance; the
+        # lazy search stops once enough ports are found.
+        ports = self._input_port_set if reverse else self._output_port_set
+        found: list[str] = []
+        for node in chain(
+            (hier_pin_path,), (v for _, v in nx.bfs_edges(G, hier_pin_path))
+        ):
+            if node in ports:
+                found.append(node)
+                if len(found) == num_ports:
+                    break
+        return found
 
     def nearest_ports_from_instance_pin_nets(
         self, inst_path: str, reverse: bool = False, num_ports: int = 1
@@ -851,6 +843,8 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         "Inst_LUT4AB_switch_matrix/inst_cus_mux161_buf_JE2BEG3"
         and a gate-level Verilog netlist, return a list of pin names
         connected to that instance, in the order they appear in the instantiation.
+        The instance is looked up with `_find_instance`, which raises ValueError if
+        the top module or an instance on the path is not found in the netlist.
 
         Parameters
         ----------
@@ -861,102 +855,8 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         -------
         list[str]
             List of pin names connected to the instance.
-
-        Raises
-        ------
-        ValueError
-            If the top module or instance is not found in the netlist.
-        RuntimeError
-            If an unexpected error occurs during hierarchy resolution.
         """
-        verilog_src: str = self.verilog_netlist_content
-        top_module: str = self.top_name
-        sep: str = self.hier_sep
-
-        # Strip comments to avoid bogus matches ---
-        # Remove block comments /* ... */
-        text = re.sub(r"/\*.*?\*/", "", verilog_src, flags=re.DOTALL)
-        # Remove line comments // ...
-        text = re.sub(r"//.*?$", "", text, flags=re.MULTILINE)
-
-        # --- 1) Collect all modules: name -> body text ---
-        module_pattern = re.compile(
-            r"module\s+(\w+)\b(.*?endmodule)",
-            re.DOTALL,
-        )
-
-        modules = {}
-        for m in module_pattern.finditer(text):
-            name = m.group(1)
-            body = m.group(2)
-            modules[name] = body
-
-        if top_module not in modules:
-            raise ValueError(f"Top module {top_module!r} not found")
-
-        # Pattern for instances inside a module ---
-        # Handles: cell_type [#(...)] inst_name ( ... );
-        inst_pattern = re.compile(
-            r"""
-            (?P<cell>\w+)                 # cell/module type
-            \s+
-            (?P<inst>\w+)                 # instance name
-            \s*
-            \(
-                (?P<pins>[^;]*?)          # pin connections until ';'
-            \)
-            \s*;
-            """,
-            re.DOTALL | re.VERBOSE,
-        )
-
-        # Pattern for pin connections: .PIN(NET) ---
-        pin_conn_pattern = re.compile(
-            r"\.\s*(?P<pin>\w+)\s*\(\s*(?P<net>[^\s\)]+)\s*\)"
-        )
-
-        # Walk the hierarchy down to the leaf instance ---
-        segments = hier_inst_path.split(sep)
-        current_module = top_module
-
-        for depth, inst_name in enumerate(segments):
-            body = modules.get(current_module)
-            if body is None:
-                raise ValueError(
-                    f"Module {current_module!r} not found while "
-                    f"resolving {hier_inst_path!r}"
-                )
-
-            found = False
-            cell_type = None
-            pins_block = None
-
-            # find the instance in the current module
-            for m in inst_pattern.finditer(body):
-                if m.group("inst") == inst_name:
-                    cell_type = m.group("cell")
-                    pins_block = m.group("pins")
-                    found = True
-                    break
-
-            if not found:
-                raise ValueError(
-                    f"Instance {inst_name!r} not found inside module {current_module!r}"
-                )
-
-            # If not yet at the leaf, descend into the instance's module type
-            if depth < len(segments) - 1:
-                current_module = cell_type
-            else:
-                # Leaf instance: parse its pin connections
-                pins_in_order: list[str] = []
-                for pm in pin_conn_pattern.finditer(pins_block):
-                    pin_name = pm.group("pin")
-                    pins_in_order.append(pin_name)
-                return pins_in_order
-
-        # Should never get here
-        raise RuntimeError("Hierarchy resolution fell through unexpectedly")
+        return list(self._find_instance(hier_inst_path).conns)
 
     def get_module_instance_nets(self, module_name: str) -> dict[str, list[str]]:
         """Extract, for a module, all inst names and nets connected to each instance.
@@ -979,68 +879,9 @@ class VerilogGateLevelTimingGraph(SDFTimingGraph):
         ValueError
             If the specified module is not found in the Verilog source.
         """
-        verilog_src: str = self.verilog_netlist_content
-
-        # Strip comments so patterns don't get confused ---
-        # Remove block comments /* ... */
-        text = re.sub(r"/\*.*?\*/", "", verilog_src, flags=re.DOTALL)
-        # Remove line comments // ...
-        text = re.sub(r"//.*?$", "", text, flags=re.MULTILINE)
-
-        # Extract the body of the target module: module <name> ... endmodule
-        module_pattern = re.compile(
-            r"module\s+(\w+)\b(.*?endmodule)",
-            re.DOTALL,
-        )
-
-        target_body = None
-        for m in module_pattern.finditer(text):
-            name = m.group(1)
-            body = m.group(2)
-            if name == module_name:
-                target_body = body
-                break
-
-        if target_body is None:
+        instances = self._netlist_modules.get(module_name)
+        if instances is None:
             raise ValueError(
                 f"Module {module_name!r} not found in provided Verilog source"
             )
-
-        # Instance pattern inside a module
-        # Matches:
-        #   cell_type inst_name ( ... );
-        inst_pattern = re.compile(
-            r"""
-            (?P<cell>\w+)                 # cell/module type
-            \s+
-            (?P<inst>\w+)                 # instance name
-            \s*
-            \(
-                (?P<pins>[^;]*?)          # pin connections up to ';'
-            \)
-            \s*;
-            """,
-            re.DOTALL | re.VERBOSE,
-        )
-
-        # Pin connection pattern: .PIN(NET)
-        # NET can be e.g. N1END3, JE2BEG0, ConfigBits[328], etc.
-        pin_conn_pattern = re.compile(
-            r"\.\s*(?P<pin>\w+)\s*\(\s*(?P<net>[^\s\)]+)\s*\)"
-        )
-
-        instance_to_nets: dict[str, list[str]] = {}
-
-        # Find all instantiations and their nets
-        for m in inst_pattern.finditer(target_body):
-            inst_name = m.group("inst")
-            pins_block = m.group("pins")
-
-            nets: list[str] = []
-            for pm in pin_conn_pattern.finditer(pins_block):
-                net = pm.group("net")
-                nets.append(net)
-
-            instance_to_nets[inst_name] = nets
-
-        return instance_to_nets
+        return {name: list(inst.conns.values()) for name, inst in instances.items()}
@@ -59,7 +59,7 @@ class SDFCellType(StrEnum):
     WIDTH = "WIDTH"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Component:
     """Represents a component in the SDF timing model.
 
@@ -91,8 +91,6 @@ class Component:
         by using a cost function to combine them.
     delay_paths : dict
         Dictionary containing detailed delay paths information.
-    is_one_cell_instance : bool
-        True if from_cell_instance and to_cell_instance are the same.
     is_timing_check : bool
         True if the component represents a timing check.
     is_timing_env : bool
@@ -120,7 +118,6 @@ class Component:
     to_cell_pin: str
     delay: float
     delay_paths: dict
-    is_one_cell_instance: bool
     is_timing_check: bool
     is_timing_env: bool
     is_absolute: bool
@@ -130,6 +127,39 @@ class Component:
     from_pin_edge: str
     to_pin_edge: str
 
+    @property
+    def is_one_cell_instance(self) -> bool:
+        """Whether the component starts and ends on the same cell instance.
+
+        Derived from the instance names instead of stored, since it can never
+        disagree with them.
+
+        Returns
+        -------
+        bool
+            True if `from_cell_instance` and `to_cell_instance` are the same.
+        """
+        return self.from_cell_instance == self.to_cell_instance
+
+
+@dataclass(frozen=True, slots=True)
+class VerilogInstance:
+    """Represents one instantiation inside a gate-level Verilog module.
+
+    Attributes
+    ----------
+    cell_type : str
+        Type of the instance, either a std-cell or another module name.
+    name : str
+        Instance name.
+    conns : dict[str, str]
+        Mapping from pin name to connected net, in instantiation order.
+    """
+
+    cell_type: str
+    name: str
+    conns: dict[str, str]
+
 
 @dataclass(slots=True, kw_only=True)
 class SDFGobject:
@@ -154,10 +184,10 @@ class SDFGobject:
         Dictionary containing header information from the SDF
         file, such as version, date,
         vendor, program, and hierarchical separator.
-    sdf_data : dict
+    sdf_data : dict | None
         The full SDF data parsed from the file, including
         cells, instances, IOPATHs,
-        interconnects, and timing checks.
+        interconnects, and timing checks. None once it has been released.
     cells : list[str]
         List of cell names defined in the SDF file.
     instances : dict[str, list[Component]]
@@ -178,7 +208,7 @@ class SDFGobject:
     nx_graph: nx.DiGraph = field(default_factory=nx.DiGraph)
     hier_sep: str
     header_info: dict
-    sdf_data: dict
+    sdf_data: dict | None
     cells: list[str]
     instances: dict[str, list[Component]]
     io_paths: list[Component]
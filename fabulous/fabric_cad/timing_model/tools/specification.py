@@ -6,10 +6,65 @@ path to the generated netlist or SDF file, and cleaning up temporary files after
 analysis.
 """
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 
+def check_input_file(path: Path, kind: str) -> None:
+    """Check that a tool input file exists and is not empty.
+
+    A single `stat` call answers both questions.
+
+    Parameters
+    ----------
+    path : Path
+        The file to check.
+    kind : str
+        Human readable file kind used in the error message, e.g. "Liberty".
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file is empty.
+    """
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{kind} file not found: {path}") from None
+    if size == 0:
+        raise ValueError(f"{kind} file is empty: {path}")
+
+
+def make_tool_output_file(prefix: str, suffix: str) -> Path:
+    """Create an empty, uniquely named file for a tool to write its output to.
+
+    The file lives in `~/.fabulous/tmp`. Every call gets its own name, so tiles
+    built in parallel, or several FABulous processes, never overwrite each
+    other's netlists and SDF files.
+
+    Parameters
+    ----------
+    prefix : str
+        Start of the file name, e.g. "synth_top_".
+    suffix : str
+        File extension, e.g. ".v".
+
+    Returns
+    -------
+    Path
+        Path of the new, empty file.
+    """
+    tmp_dir = Path.home() / ".fabulous" / "tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=tmp_dir)
+    os.close(fd)
+    return Path(name)
+
+
 class SynthTool(ABC):
     """Abstract base class for synthesis tool backends.
 
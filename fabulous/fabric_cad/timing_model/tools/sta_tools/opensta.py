@@ -9,7 +9,11 @@ from pathlib import Path
 
 from loguru import logger
 
-from fabulous.fabric_cad.timing_model.tools.specification import StaTool
+from fabulous.fabric_cad.timing_model.tools.specification import (
+    StaTool,
+    check_input_file,
+    make_tool_output_file,
+)
 
 
 class OpenStaTool(StaTool):
@@ -71,37 +75,40 @@ class OpenStaTool(StaTool):
         """
         self._check_errors()
 
-        sta_tcl_script: str = ""
-        if isinstance(self.lib_files, Path):
-            sta_tcl_script += f"read_liberty {self.lib_files}\n"
+        lib_files = (
+            [self.lib_files] if isinstance(self.lib_files, Path) else self.lib_files
+        )
+        if self.spef_files is None:
+            spef_files = []
+        elif isinstance(self.spef_files, Path):
+            spef_files = [self.spef_files]
         else:
-            for lib in self.lib_files:
-                sta_tcl_script += f"read_liberty {lib}\n"
-        sta_tcl_script += f"read_verilog {self.verilog_netlist}\n"
-        sta_tcl_script += f"link_design {self.top_name}\n"
-        if self.spef_files is not None:
-            if isinstance(self.spef_files, Path):
-                sta_tcl_script += f"read_spef {self.spef_files}\n"
-            elif isinstance(self.spef_files, list):
-                for spef in self.spef_files:
-                    sta_tcl_script += f"read_spef {spef}\n"
-        sta_tcl_script += "write_sdf {}\n".format("{sdf_path}")
-        sta_tcl_script += "exit\n"
-
-        path: Path = Path.home() / ".fabulous" / "tmp" / f"sta_{self.top_name}_tmp.sdf"
-
-        path.parent.mkdir(parents=True, exist_ok=True)
+            spef_files = self.spef_files
+
+        path: Path = make_tool_output_file(f"sta_{self.top_name}_", ".sdf")
+
+        lines: list[str] = [f"read_liberty {lib}" for lib in lib_files]
+        lines.append(f"read_verilog {self.verilog_netlist}")
+        lines.append(f"link_design {self.top_name}")
+        lines.extend(f"read_spef {spef}" for spef in spef_files)
+        lines.append(f"write_sdf {path}")
+        lines.append("exit")
+        sta_tcl_script = "\n".join(lines) + "\n"
 
         logger.debug(f"Generating SDF file at temporary path: {path}")
 
-        self._call_external(
-            self.sta_executable,
-            stdin_data=sta_tcl_script.format(sdf_path=path),
-            debug=self.debug,
-        )
+        try:
+            self._call_external(
+                self.sta_executable,
+                stdin_data=sta_tcl_script,
+                debug=self.debug,
+            )
+        except RuntimeError:
+            path.unlink(missing_ok=True)
+            raise
 
-        content: str = path.read_text()
-        if not content:
+        # The SDF is parsed later, only check that OpenSTA wrote something
+        if path.stat().st_size == 0:
             path.unlink()
             raise RuntimeError(
                 "Failed to generate SDF file using OpenSTA. No content in SDF file."
@@ -290,44 +297,32 @@ class OpenStaTool(StaTool):
     def _check_errors(self) -> None:
         """Check for errors in the provided configuration parameters.
 
+        Input files are checked with `check_input_file`, which raises for
+        missing or empty files.
+
         Raises
         ------
         TypeError
             If any parameter is of incorrect type.
-        FileNotFoundError
-            If any specified file does not exist.
-        ValueError
-            If any specified file is empty.
         """
         if not isinstance(self.verilog_netlist, Path):
             raise TypeError("verilog_netlist must be a pathlib.Path object.")
-        if not self.verilog_netlist.exists():
-            raise FileNotFoundError(
-                f"Verilog netlist file not found: {self.verilog_netlist}"
-            )
-        if self.verilog_netlist.stat().st_size == 0:
-            raise ValueError(f"Verilog netlist file is empty: {self.verilog_netlist}")
+        check_input_file(self.verilog_netlist, "Verilog netlist")
 
         if not isinstance(self.lib_files, list | Path):
             raise TypeError(
                 "liberty_files must be a list of pathlib.Path objects or a "
                 "single pathlib.Path object."
             )
-        if isinstance(self.lib_files, list):
-            for lib in self.lib_files:
-                if not isinstance(lib, Path):
-                    raise TypeError(
-                        "Each item in liberty_files list must be a pathlib.Path object."
-                    )
-                if not lib.exists():
-                    raise FileNotFoundError(f"Liberty file not found: {lib}")
-                if lib.stat().st_size == 0:
-                    raise ValueError(f"Liberty file is empty: {lib}")
-        else:
-            if not self.lib_files.exists():
-                raise FileNotFoundError(f"Liberty file not found: {self.lib_files}")
-            if self.lib_files.stat().st_size == 0:
-                raise ValueError(f"Liberty file is empty: {self.lib_files}")
+        lib_files = (
+            self.lib_files if isinstance(self.lib_files, list) else [self.lib_files]
+        )
+        for lib in lib_files:
+            if not isinstance(lib, Path):
+                raise TypeError(
+                    "Each item in liberty_files list must be a pathlib.Path object."
+                )
+            check_input_file(lib, "Liberty")
 
         if not isinstance(self.top_name, str):
             raise TypeError("top_name must be a string.")
@@ -339,21 +334,18 @@ class OpenStaTool(StaTool):
                 "spef_files must be a list of pathlib.Path objects or a single "
                 "pathlib.Path object or None."
             )
-        if isinstance(self.spef_files, list):
-            for spef in self.spef_files:
-                if not isinstance(spef, Path):
-                    raise TypeError(
-                        "Each item in spef_files list must be a pathlib.Path object."
-                    )
-                if not spef.exists():
-                    raise FileNotFoundError(f"SPEF file not found: {spef}")
-                if spef.stat().st_size == 0:
-                    raise ValueError(f"SPEF file is empty: {spef}")
-        elif isinstance(self.spef_files, Path):
-            if not self.spef_files.exists():
-                raise FileNotFoundError(f"SPEF file not found: {self.spef_files}")
-            if self.spef_files.stat().st_size == 0:
-                raise ValueError(f"SPEF file is empty: {self.spef_files}")
+        if self.spef_files is None:
+            spef_files = []
+        elif isinstance(self.spef_files, list):
+            spef_files = self.spef_files
+        else:
+            spef_files = [self.spef_files]
+        for spef in spef_files:
+            if not isinstance(spef, Path):
+                raise TypeError(
+                    "Each item in spef_files list must be a pathlib.Path object."
+                )
+            check_input_file(spef, "SPEF")
 
         if not isinstance(self.debug, bool):
             raise TypeError("debug must be a boolean.")
@@ -13,7 +13,11 @@ from pathlib import Path
 
 from loguru import logger
 
-from fabulous.fabric_cad.timing_model.tools.specification import SynthTool
+from fabulous.fabric_cad.timing_model.tools.specification import (
+    SynthTool,
+    check_input_file,
+    make_tool_output_file,
+)
 
 
 class YosysTool(SynthTool):
@@ -112,75 +116,70 @@ class YosysTool(SynthTool):
             self.netlist_path = self.verilog_files
             return
 
+        lib_files = (
+            [self.lib_files] if isinstance(self.lib_files, Path) else self.lib_files
+        )
+        verilog_files = (
+            [self.verilog_files]
+            if isinstance(self.verilog_files, Path)
+            else self.verilog_files
+        )
+        # The first liberty file provides the cells for mapping.
+        map_lib = lib_files[0]
+
         # Generate Yosys synthesis TCL script
-        synth_tcl_script: str = ""
-        synth_tcl_script += "yosys -import\n"
-        if isinstance(self.lib_files, Path):
-            synth_tcl_script += f"read_liberty -lib {self.lib_files}\n"
-        else:
-            for lib in self.lib_files:
-                synth_tcl_script += f"read_liberty -lib {lib}\n"
-        if isinstance(self.verilog_files, Path):
-            synth_tcl_script += f"read_verilog -overwrite -sv {self.verilog_files}\n"
-        else:
-            for vf in self.verilog_files:
-                synth_tcl_script += f"read_verilog -overwrite -sv {vf}\n"
+        lines: list[str] = ["yosys -import"]
+        lines.extend(f"read_liberty -lib {lib}" for lib in lib_files)
+        lines.extend(f"read_verilog -overwrite -sv {vf}" for vf in verilog_files)
         if self.flat:
-            synth_tcl_script += f"synth -flatten -top {self.top_name}\n"
+            lines.append(f"synth -flatten -top {self.top_name}")
         else:
-            synth_tcl_script += f"synth -top {self.top_name}\n"
-        synth_tcl_script += f"renames -top {self.top_name}\n"
-        synth_tcl_script += "renames -wire\n"
+            lines.append(f"synth -top {self.top_name}")
+        lines.append(f"renames -top {self.top_name}")
+        lines.append("renames -wire")
 
         if self.techmap_files is not None:
-            for tm in self.techmap_files:
-                synth_tcl_script += f"techmap -map {tm}\n"
-            synth_tcl_script += "simplemap\n"
-
-        synth_tcl_script += f"clockgate -liberty  {
-            self.lib_files[0] if isinstance(self.lib_files, list) else self.lib_files
-        }\n"
-        synth_tcl_script += f"dfflibmap -liberty  {
-            self.lib_files[0] if isinstance(self.lib_files, list) else self.lib_files
-        }\n"
-        synth_tcl_script += "setundef -zero\n"
-        synth_tcl_script += "splitnets\n"
+            lines.extend(f"techmap -map {tm}" for tm in self.techmap_files)
+            lines.append("simplemap")
+
+        lines.append(f"clockgate -liberty  {map_lib}")
+        lines.append(f"dfflibmap -liberty  {map_lib}")
+        lines.append("setundef -zero")
+        lines.append("splitnets")
 
         if (
             self.tiehi_cell_and_port is not None
             and self.tielo_cell_and_port is not None
         ):
-            synth_tcl_script += (
+            lines.append(
                 f"hilomap -hicell {self.tiehi_cell_and_port} "
-                f"-locell {self.tielo_cell_and_port}\n"
+                f"-locell {self.tielo_cell_and_port}"
             )
         if self.min_buf_cell_and_ports is not None:
-            synth_tcl_script += f"insbuf -buf {self.min_buf_cell_and_ports}\n"
-
-        synth_tcl_script += "tribuf\n"
-        synth_tcl_script += f"abc -liberty {
-            self.lib_files[0] if isinstance(self.lib_files, list) else self.lib_files
-        }\n"
-        synth_tcl_script += "opt -purge -full\n"
-        synth_tcl_script += "write_verilog -noattr -noexpr {}\n".format(
-            "{synth_output_file}"
-        )
+            lines.append(f"insbuf -buf {self.min_buf_cell_and_ports}")
 
-        path: Path = Path.home() / ".fabulous" / "tmp" / f"synth_{self.top_name}_tmp.v"
-
-        path.parent.mkdir(parents=True, exist_ok=True)
+        lines.append("tribuf")
+        lines.append(f"abc -liberty {map_lib}")
+        lines.append("opt -purge -full")
+        path: Path = make_tool_output_file(f"synth_{self.top_name}_", ".v")
+        lines.append(f"write_verilog -noattr -noexpr {path}")
+        synth_tcl_script = "\n".join(lines) + "\n"
 
         logger.debug(f"Generating Synthesized Verilog file at temporary path: {path}")
 
-        self._call_external(
-            self.synth_executable,
-            stdin_data=synth_tcl_script.format(synth_output_file=path),
-            debug=self.debug,
-            args=["-C"],
-        )
+        try:
+            self._call_external(
+                self.synth_executable,
+                stdin_data=synth_tcl_script,
+                debug=self.debug,
+                args=["-C"],
+            )
+        except RuntimeError:
+            path.unlink(missing_ok=True)
+            raise
 
-        content: str = path.read_text()
-        if not content:
+        # Only the size is needed here, the netlist is read once below.
+        if path.stat().st_size == 0:
             path.unlink()
             raise RuntimeError(
                 "Failed to generate gate-level netlist using Yosys. "
@@ -379,17 +378,15 @@ class YosysTool(SynthTool):
         """Check YosysTool for errors in the configuration parameters.
 
         Helper method to validate the configuration parameters before
-        running synthesis. It checks
+        running synthesis. Input files are checked with
+        `check_input_file`, which raises for missing or empty files.
 
         Raises
         ------
         TypeError
             If any parameter has an incorrect type.
-        FileNotFoundError
-            If any specified file does not exist.
         ValueError
-            If any specified file is empty or if there are invalid
-            combinations of configuration values.
+            If there are invalid combinations of configuration values.
         """
         if not isinstance(self.verilog_files, list | Path):
             raise TypeError(
@@ -401,26 +398,17 @@ class YosysTool(SynthTool):
                 "If is_gate_level True, verilog_files must be a pathlib.Path obj."
                 " Multiple Verilog files are not supported for gate-level netlists."
             )
-        if isinstance(self.verilog_files, list):
-            for vf in self.verilog_files:
-                if not isinstance(vf, Path):
-                    raise TypeError(
-                        "Each item in verilog_files list must be a pathlib.Path object."
-                    )
-                if not vf.exists():
-                    raise FileNotFoundError(f"Verilog file not found: {vf}")
-                if vf.stat().st_size == 0:
-                    raise ValueError(f"Verilog file is empty: {vf}")
-        else:
-            if not isinstance(self.verilog_files, Path):
+        verilog_files = (
+            self.verilog_files
+            if isinstance(self.verilog_files, list)
+            else [self.verilog_files]
+        )
+        for vf in verilog_files:
+            if not isinstance(vf, Path):
                 raise TypeError(
-                    "verilog_files must be a list of pathlib.Path objects or "
-                    "a single pathlib.Path object."
+                    "Each item in verilog_files list must be a pathlib.Path object."
                 )
-            if not self.verilog_files.exists():
-                raise FileNotFoundError(f"Verilog file not found: {self.verilog_files}")
-            if self.verilog_files.stat().st_size == 0:
-                raise ValueError(f"Verilog file is empty: {self.verilog_files}")
+            check_input_file(vf, "Verilog")
 
         if not isinstance(self.is_gate_level, bool):
             raise TypeError("is_gate_level must be a boolean value.")
@@ -446,10 +434,7 @@ class YosysTool(SynthTool):
                     raise TypeError(
                         "Each item in techmap_files list must be a pathlib.Path object."
                     )
-                if not tm.exists():
-                    raise FileNotFoundError(f"Techmap file not found: {tm}")
-                if tm.stat().st_size == 0:
-                    raise ValueError(f"Techmap file is empty: {tm}")
+                check_input_file(tm, "Techmap")
 
         if not isinstance(self.tiehi_cell_and_port, str | type(None)):
             raise TypeError("tiehi_cell_and_port must be a string or None.")
@@ -7,6 +7,7 @@ including I/O types, directions, sides, and configuration modes.
 from decimal import Decimal
 from enum import Enum, StrEnum
 from functools import total_ordering
+from string import ascii_uppercase
 from typing import NamedTuple
 
 
@@ -173,3 +174,9 @@ SWITCH_MATRIX_CONSTANTS: tuple[str, ...] = (
     "VDD0",
     "VDD",
 )
+
+# Z-position letters given to the BELs of a tile, in declaration order. Tiles
+# with more than 26 BELs continue with two-letter names (AA, AB, ...).
+BEL_LETTERS: tuple[str, ...] = tuple(ascii_uppercase) + tuple(
+    a + b for a in ascii_uppercase for b in ascii_uppercase
+)
@@ -438,6 +438,29 @@ class FABulous_API:
         """
         return model_gen_npnr.genNextpnrModel(self.fabric)
 
+    def write_routing_model(self, output_dir: Path) -> None:
+        """Write the Nextpnr model of the fabric straight to files.
+
+        Unlike `gen_routing_model` the model is never held in memory as a
+        whole, which matters for the pip file of large fabrics.
+
+        Parameters
+        ----------
+        output_dir : Path
+            Directory receiving `pips.txt`, `bel.txt`, `bel.v2.txt`, `bel.v3.txt`
+            and `template.pcf`.
+        """
+        with (
+            (output_dir / "pips.txt").open("w") as pip_file,
+            (output_dir / "bel.txt").open("w") as bel_file,
+            (output_dir / "bel.v2.txt").open("w") as belv2_file,
+            (output_dir / "bel.v3.txt").open("w") as belv3_file,
+            (output_dir / "template.pcf").open("w") as constrain_file,
+        ):
+            model_gen_npnr.write_nextpnr_model(
+                self.fabric, pip_file, bel_file, belv2_file, belv3_file, constrain_file
+            )
+
     def getBels(self) -> list[Bel]:
         """Return all unique Bels within a fabric.
 
@@ -343,26 +343,10 @@ class FabricGenCommandSet(ReplCommandSet):
         """
         repl = self._cmd
         logger.info("Generating npnr model")
-        npnr_model = repl.fabulousAPI.gen_routing_model()
-        logger.info(f"output file: {repl.projectDir}/{META_DATA_DIR}/pips.txt")
-        with Path(f"{repl.projectDir}/{META_DATA_DIR}/pips.txt").open("w") as f:
-            f.write(npnr_model[0])
-
-        logger.info(f"output file: {repl.projectDir}/{META_DATA_DIR}/bel.txt")
-        with Path(f"{repl.projectDir}/{META_DATA_DIR}/bel.txt").open("w") as f:
-            f.write(npnr_model[1])
-
-        logger.info(f"output file: {repl.projectDir}/{META_DATA_DIR}/bel.v2.txt")
-        with Path(f"{repl.projectDir}/{META_DATA_DIR}/bel.v2.txt").open("w") as f:
-            f.write(npnr_model[2])
-
-        logger.info(f"output file: {repl.projectDir}/{META_DATA_DIR}/bel.v3.txt")
-        with Path(f"{repl.projectDir}/{META_DATA_DIR}/bel.v3.txt").open("w") as f:
-            f.write(npnr_model[3])
-
-        logger.info(f"output file: {repl.projectDir}/{META_DATA_DIR}/template.pcf")
-        with Path(f"{repl.projectDir}/{META_DATA_DIR}/template.pcf").open("w") as f:
-            f.write(npnr_model[4])
+        output_dir = Path(f"{repl.projectDir}/{META_DATA_DIR}")
+        repl.fabulousAPI.write_routing_model(output_dir)
+        for name in ("pips.txt", "bel.txt", "bel.v2.txt", "bel.v3.txt", "template.pcf"):
+            logger.info(f"output file: {output_dir / name}")
 
         estimate_path = Path(
             f"{repl.projectDir}/{META_DATA_DIR}/placement_estimate.txt"
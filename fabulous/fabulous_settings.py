@@ -52,7 +52,9 @@ class FABulousSettings(BaseSettings):
     (including PATH updates for oss-cad-suite) can occur beforehand.
     """
 
-    model_config = SettingsConfigDict(env_prefix="FAB_", case_sensitive=False)
+    model_config = SettingsConfigDict(
+        env_prefix="FAB_", case_sensitive=False, frozen=True
+    )
 
     user_config_dir: Path = Field(default_factory=lambda: FAB_USER_CONFIG_DIR)
 
@@ -168,7 +170,7 @@ class FABulousSettings(BaseSettings):
         proj_lang = info.data.get("proj_lang")
         if value is None or value == "":
             if p := info.data.get("proj_dir"):
-                p = Path(p).absolute()
+                p = (p if isinstance(p, Path) else Path(p)).absolute()
             else:
                 raise ValueError("Project directory is not set.")
             if proj_lang == HDLType.VHDL:
@@ -207,7 +209,9 @@ class FABulousSettings(BaseSettings):
             # models_pack path is stored as a relative path in .env.
             # Resolve it relative to the .FABulous directory (where .env lives).
             if proj_dir := info.data.get("proj_dir"):
-                proj_dir = Path(proj_dir).absolute()
+                if not isinstance(proj_dir, Path):
+                    proj_dir = Path(proj_dir)
+                proj_dir = proj_dir.absolute()
                 if not proj_dir.exists():
                     raise ValueError(f"Project directory {proj_dir} does not exist.")
             else:
@@ -309,7 +313,7 @@ class FABulousSettings(BaseSettings):
         """Check if project_dir is a valid directory."""
         if value is None:
             raise ValueError("Project directory is not set.")
-        if not (Path(value) / ".FABulous").exists():
+        if not (value / ".FABulous").exists():
             raise ValueError(f"{value} is not a FABulous project")
         return value.resolve()
 
@@ -384,8 +388,10 @@ class FABulousSettings(BaseSettings):
         """
         if isinstance(value, Path):
             return value
-        if isinstance(value, str) and value != "" and Path(value).exists():
-            return Path(value).resolve()
+        if isinstance(value, str) and value != "":
+            path = Path(value)
+            if path.exists():
+                return path.resolve()
         tool_map = {
             "yosys_path": "yosys",
             "opensta_path": "sta",
@@ -426,6 +432,9 @@ class FABulousSettings(BaseSettings):
         4. ``pdk`` set, ``pdk_root`` None, not ciel       -> raise ValueError
         5. Both set, not ciel family               -> info log + return
         6. Both set, ciel family                   -> hash resolution + enable
+
+        The settings model is frozen, so the resolved PDK fields are written with
+        ``object.__setattr__`` while the instance is still being built.
         """
         # Case 1: neither set
         if self.pdk is None and self.pdk_root is None:
@@ -456,7 +465,9 @@ class FABulousSettings(BaseSettings):
         if self.pdk_root is None:
             if ciel_family is not None:
                 # Case 3: supported family -> auto-resolve root from ciel home
-                self.pdk_root = Path(get_ciel_home()) / ciel_family.name
+                object.__setattr__(
+                    self, "pdk_root", Path(get_ciel_home()) / ciel_family.name
+                )
             else:
                 # Case 4: unsupported family without root -> error
                 raise ValueError(
@@ -485,7 +496,7 @@ class FABulousSettings(BaseSettings):
 
         recommended_hash = get_pdk_hash(ciel_family.name)
         if self.pdk_hash is None:
-            self.pdk_hash = recommended_hash
+            object.__setattr__(self, "pdk_hash", recommended_hash)
 
         elif self.pdk_hash != recommended_hash:
             logger.warning(
@@ -510,7 +521,7 @@ class FABulousSettings(BaseSettings):
                 "the variant name. "
                 "Auto resolving to the default variant for the family."
             )
-            self.pdk = ciel_family.default_variant
+            object.__setattr__(self, "pdk", ciel_family.default_variant)
 
         logger.info(
             f"Auto-resolved PDK hash: {self.pdk_hash[:12]} for family "
@@ -583,17 +594,13 @@ def init_context(
                 "but this is not found, this entry is ignored"
             )
 
-    # 3. cwd project dir .env
-    if project_dir is None and (Path().cwd() / ".FABulous" / ".env").exists():
-        env_files.append(Path().cwd() / ".FABulous" / ".env")
-        logger.debug("Loading project .env file from cwd")
-
-    # 4. explicit project dir .env
-    if project_dir is not None and (project_dir / ".FABulous" / ".env").exists():
-        env_files.append(project_dir / ".FABulous" / ".env")
-        logger.debug(f"Loading project .env file from project_dir: {project_dir}")
+    # 3. project dir .env (explicit project dir, otherwise cwd)
+    project_env = (project_dir or Path.cwd()) / ".FABulous" / ".env"
+    if project_env.is_file():
+        env_files.append(project_env)
+        logger.debug(f"Loading project .env file from {project_env}")
 
-    # 5. User-provided project .env file (highest .env priority)
+    # 4. User-provided project .env file (highest .env priority)
     if project_dot_env and project_dot_env.exists():
         env_files.append(project_dot_env)
         logger.info(f"Loading project .env file from {project_dot_env}")
@@ -668,7 +675,8 @@ def is_pdk_config_set() -> bool:
         True if both ``pdk`` and ``pdk_root`` are set in the global context,
         False otherwise.
     """
-    return get_context().pdk is not None and get_context().pdk_root is not None
+    context = get_context()
+    return context.pdk is not None and context.pdk_root is not None
 
 
 def _log_settings_validation_error(error: ValidationError, project_dir: Path) -> None:
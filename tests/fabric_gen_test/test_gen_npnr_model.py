@@ -1,13 +1,21 @@
 """Tests for nextpnr model generation, focusing on bel.v3 timing output."""
 
+from pathlib import Path
+
 from pytest_mock import MockerFixture
 
+import fabulous.fabric_cad.gen_design_top_wrapper as top_wrapper_mod
 from fabulous.fabric_cad.gen_npnr_model import (
     PLACEMENT_ESTIMATE_TEXT,
     belLines,
     genNextpnrModel,
+    writeNextpnrPipFile,
+)
+from fabulous.fabric_cad.timing_model.FABulous_timing_model_interface import (
+    FABulousTimingModelInterface,
 )
 from fabulous.fabric_definition.bel import Bel
+from fabulous.fabric_definition.define import BEL_LETTERS
 from fabulous.fabulous_repl.fabulous_repl import FABulousREPL
 
 
@@ -113,3 +121,94 @@ def test_genNextpnrModel_bel_timing_unaffected_by_real_pip_delay(
     assert "Delay,Ci,Co,0.2,Ci/Co?" in belv3
     assert "SetupHold,I0,CLK,2.5,0.1,FF=1" in belv3
     assert "ClkToOut,Q,CLK,1.0,FF=1" in belv3
+
+
+def test_genNextpnrModel_queries_each_pip_delay_once(
+    cli: FABulousREPL, mocker: MockerFixture
+) -> None:
+    """Tile instances of the same type reuse the delay of an already seen pip."""
+    fabric = cli.fabulousAPI.fabric
+    tile_names = set(fabric.tileDic) | {
+        super_tile.name for *_, super_tile in fabric.iter_super_tile_placements()
+    }
+    delay_model = FABulousTimingModelInterface.__new__(FABulousTimingModelInterface)
+    delay_model.tile_delay_dict = {}
+    delay_model.timing_models = {name: mocker.Mock() for name in tile_names}
+    for model in delay_model.timing_models.values():
+        model.pip_delay.return_value = 6.0
+
+    pip_str, *_ = genNextpnrModel(fabric, delay_model)
+
+    queries = [
+        (name, *call.args)
+        for name, model in delay_model.timing_models.items()
+        for call in model.pip_delay.call_args_list
+    ]
+    assert queries
+    assert len(queries) == len(set(queries))
+    assert ",6.0," in pip_str
+
+
+def test_write_routing_model_matches_gen_routing_model(
+    cli: FABulousREPL, tmp_path: Path
+) -> None:
+    """The streamed model files hold the generated model, newline terminated."""
+    cli.fabulousAPI.write_routing_model(tmp_path)
+
+    model = cli.fabulousAPI.gen_routing_model()
+    names = ("pips.txt", "bel.txt", "bel.v2.txt", "bel.v3.txt", "template.pcf")
+    for name, content in zip(names, model, strict=True):
+        assert (tmp_path / name).read_text() == f"{content}\n"
+
+
+def test_write_pip_file_matches_gen_routing_model(
+    cli: FABulousREPL, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """The pip file is written without generating any BEL output."""
+    bel_lines = mocker.patch(
+        "fabulous.fabric_cad.gen_npnr_model.belLines", side_effect=belLines
+    )
+    pip_file = tmp_path / "pips.txt"
+
+    writeNextpnrPipFile(cli.fabulousAPI.fabric, pip_file)
+
+    bel_lines.assert_not_called()
+    pip_str = cli.fabulousAPI.gen_routing_model()[0]
+    assert pip_file.read_text() == f"{pip_str}\n"
+
+
+def test_bel_letters_continue_past_z() -> None:
+    """Tiles with more than 26 BELs get two-letter Z-positions after Z."""
+    assert BEL_LETTERS[:3] == ("A", "B", "C")
+    assert BEL_LETTERS[25:28] == ("Z", "AA", "AB")
+    assert len(set(BEL_LETTERS)) == len(BEL_LETTERS)
+
+
+def test_top_wrapper_uses_bel_letters_past_z(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """The top wrapper names BELs past Z like the nextpnr model does."""
+    bels = []
+    for _ in range(28):
+        bel = mocker.Mock(externalInput=["PAD"], externalOutput=[], prefix="")
+        bel.name = "IO_PAD"
+        bel.inputs = ["I"]
+        bel.outputs = ["O"]
+        bels.append(bel)
+    fabric = mocker.Mock(numberOfColumns=1, numberOfRows=1)
+    fabric.getBelsByTileXY.return_value = bels
+    fabric.iter_super_tile_placements.return_value = []
+    user_design = mocker.Mock(language="verilog", module_name="user")
+    user_design.name = "user"
+    user_design.ports_vectors = {"internal": []}
+    mocker.patch.object(top_wrapper_mod, "parseBelFile", return_value=user_design)
+    design = tmp_path / "user.v"
+    design.write_text("module user(); endmodule\n")
+    output = tmp_path / "top_wrapper.v"
+
+    top_wrapper_mod.generateUserDesignTopWrapper(fabric, design, output)
+
+    text = output.read_text()
+    letters = {f'BEL="X0Y0.{letter}"' for letter in BEL_LETTERS[:28]}
+    assert all(letter in text for letter in letters)
+    assert text.count('BEL="X0Y0.') == 28
@@ -756,6 +756,53 @@ def test_find_matching_files_filters_dirs_and_files(
     assert result == [keep_dir / "a.v"]
 
 
+def test_find_matching_files_mixes_literal_and_regex_patterns(
+    tmp_path: Path, bare_model: FABulousTileTimingModel
+) -> None:
+    for name in ("old_macro", "build_1", "build_x"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}.v").write_text("module m; endmodule")
+
+    result = bare_model._find_matching_files(  # noqa: SLF001
+        tmp_path,
+        r".*\.v$",
+        exclude_dir_patterns=["macro", r"^build_\d+$"],
+    )
+
+    assert result == [tmp_path / "build_x" / "build_x.v"]
+
+
+def test_find_matching_files_skips_unreadable_directories(
+    tmp_path: Path, bare_model: FABulousTileTimingModel, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "keep").mkdir()
+    (tmp_path / "keep" / "a.v").write_text("module a; endmodule")
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "b.v").write_text("module b; endmodule")
+    scandir = tm_mod.os.scandir
+
+    def fake_scandir(path: str) -> object:
+        if Path(path).name == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(tm_mod.os, "scandir", fake_scandir)
+
+    result = bare_model._find_matching_files(tmp_path, r".*\.v$")  # noqa: SLF001
+
+    assert result == [tmp_path / "keep" / "a.v"]
+
+
+def test_find_matching_files_missing_root_returns_empty(
+    tmp_path: Path, bare_model: FABulousTileTimingModel
+) -> None:
+    result = bare_model._find_matching_files(  # noqa: SLF001
+        tmp_path / "missing", r".*\.v$"
+    )
+
+    assert result == []
+
+
 def test_find_matching_files_invalid_root_raises(
     bare_model: FABulousTileTimingModel,
 ) -> None:
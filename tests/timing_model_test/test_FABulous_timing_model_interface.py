@@ -0,0 +1,61 @@
+import pytest
+from pytest_mock import MockerFixture
+
+import fabulous.fabric_cad.timing_model.FABulous_timing_model_interface as itf_mod
+from fabulous.fabric_cad.timing_model.FABulous_timing_model_interface import (
+    FABulousTimingModelInterface,
+)
+
+
+@pytest.fixture
+def bare_interface(mocker: MockerFixture) -> FABulousTimingModelInterface:
+    i = FABulousTimingModelInterface.__new__(FABulousTimingModelInterface)
+    i.tile_delay_dict = {}
+    i.timing_models = {"TILE_A": mocker.Mock()}
+    i.timing_models["TILE_A"].pip_delay.return_value = 0.25
+    return i
+
+
+def test_pip_delay_caches_per_tile(
+    bare_interface: FABulousTimingModelInterface,
+) -> None:
+    assert bare_interface.pip_delay("TILE_A", "A", "Y") == 0.25
+    assert bare_interface.pip_delay("TILE_A", "A", "Y") == 0.25
+
+    bare_interface.timing_models["TILE_A"].pip_delay.assert_called_once_with("A", "Y")
+    assert bare_interface.tile_delay_dict == {"TILE_A": {("A", "Y"): 0.25}}
+
+
+def test_pip_delay_unknown_tile_raises(
+    bare_interface: FABulousTimingModelInterface,
+) -> None:
+    with pytest.raises(ValueError, match="TILE_B"):
+        bare_interface.pip_delay("TILE_B", "A", "Y")
+    assert bare_interface.tile_delay_dict == {}
+
+
+def test_pip_delay_keeps_dotted_pip_names_apart(
+    bare_interface: FABulousTimingModelInterface,
+) -> None:
+    bare_interface.pip_delay("TILE_A", "A.B", "C")
+    bare_interface.pip_delay("TILE_A", "A", "B.C")
+
+    assert bare_interface.timing_models["TILE_A"].pip_delay.call_count == 2
+
+
+def test_init_builds_a_model_for_every_tile(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        itf_mod,
+        "FABulousTileTimingModel",
+        side_effect=lambda tile_name, **_kwargs: mocker.Mock(tile_name=tile_name),
+    )
+    mocker.patch.object(itf_mod, "get_context", return_value=mocker.Mock(max_worker=4))
+    fabric = mocker.Mock()
+    fabric.tileDic = {"LUT4AB": None, "DSP_top": None, "DSP_bot": None}
+
+    interface = FABulousTimingModelInterface(config=mocker.Mock(), fabric=fabric)
+
+    assert list(interface.timing_models) == ["LUT4AB", "DSP_top", "DSP_bot"]
+    assert all(
+        model.tile_name == name for name, model in interface.timing_models.items()
+    )
@@ -0,0 +1,61 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from fabulous.fabric_cad.timing_model.tools.sta_tools.opensta import OpenStaTool
+
+
+@pytest.fixture
+def opensta_tool(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> OpenStaTool:
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    tool = OpenStaTool(
+        sta_executable="sta",
+        liberty_files=tmp_path / "cells.lib",
+        top_name="top",
+        verilog_netlist=tmp_path / "top.v",
+    )
+    mocker.patch.object(tool, "_check_errors")
+    mocker.patch.object(tool, "_call_external")
+    return tool
+
+
+def _write_sdf(content: str) -> Callable[..., None]:
+    def fake_sta(*_args: object, stdin_data: str, **_kwargs: object) -> None:
+        line = next(line for line in stdin_data.splitlines() if "write_sdf" in line)
+        Path(line.split()[-1]).write_text(content)
+
+    return fake_sta
+
+
+def test_analyze_keeps_generated_sdf(opensta_tool: OpenStaTool) -> None:
+    opensta_tool._call_external.side_effect = _write_sdf("(DELAYFILE)")  # noqa: SLF001
+
+    opensta_tool.sta_analyze()
+
+    sdf = opensta_tool.sta_sdf_file
+    assert sdf.read_text() == "(DELAYFILE)"
+    assert sdf.parent == Path.home() / ".fabulous" / "tmp"
+    assert sdf.name.startswith("sta_top_")
+
+
+def test_analyze_uses_a_unique_sdf_per_run(opensta_tool: OpenStaTool) -> None:
+    opensta_tool._call_external.side_effect = _write_sdf("(DELAYFILE)")  # noqa: SLF001
+
+    opensta_tool.sta_analyze()
+    first = opensta_tool.sta_sdf_file
+    opensta_tool.sta_analyze()
+
+    assert opensta_tool.sta_sdf_file != first
+
+
+def test_analyze_rejects_empty_sdf(opensta_tool: OpenStaTool) -> None:
+    opensta_tool._call_external.side_effect = _write_sdf("")  # noqa: SLF001
+
+    with pytest.raises(RuntimeError, match="No content"):
+        opensta_tool.sta_analyze()
+    assert not list((Path.home() / ".fabulous" / "tmp").iterdir())
+    assert opensta_tool.sdf_path is None
@@ -34,7 +34,6 @@ def make_component(
         to_cell_pin=to_cell_pin,
         delay=delay,
         delay_paths={"fast": {"min": delay, "max": delay}},
-        is_one_cell_instance=(from_cell_instance == to_cell_instance),
         is_timing_check=False,
         is_timing_env=False,
         is_absolute=True,
@@ -153,10 +152,10 @@ def sdf_graph(
     monkeypatch.setattr(
         base_mod,
         "gen_timing_digraph",
-        lambda *_args: fake_sdf_gobject,
+        lambda *_args, **_kwargs: fake_sdf_gobject,
     )
 
-    return SDFTimingGraph(sdf_file, DelayType.MAX_ALL)
+    return SDFTimingGraph(sdf_file, DelayType.MAX_ALL, keep_raw_sdf=True)
 
 
 def test_inherits_base_initialization(sdf_graph: SDFTimingGraph) -> None:
@@ -372,6 +371,18 @@ def test_earliest_common_nodes_no_common_reachable_node_returns_empty(
     assert "F" in dists
 
 
+def test_earliest_common_nodes_stops_searching_once_nothing_is_common(
+    sdf_graph: SDFTimingGraph,
+) -> None:
+    best_nodes, best_cost, dists = sdf_graph.earliest_common_nodes(
+        ["A", "F", "B"], mode="max"
+    )
+
+    assert best_nodes == []
+    assert best_cost is None
+    assert "B" not in dists
+
+
 def test_earliest_common_nodes_choose_one_by_cost() -> None:
     graph = nx.DiGraph()
     comp = make_component(
@@ -535,6 +546,34 @@ def test_path_to_nearest_target_sentinel_no_reachable_target_returns_none(
     assert not any("_sentinel_" in str(node) for node in sdf_graph.graph.nodes)
 
 
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_path_to_nearest_target_sentinel_tie_goes_to_first_listed_target(
+    sdf_graph: SDFTimingGraph, weight: str | None
+) -> None:
+    sdf_graph.graph.add_edge("A", "T1", weight=1.0)
+    sdf_graph.graph.add_edge("A", "T2", weight=1.0)
+
+    _, closest = sdf_graph.path_to_nearest_target_sentinel(
+        "A", ["T2", "T1"], weight=weight
+    )
+    _, closest_swapped = sdf_graph.path_to_nearest_target_sentinel(
+        "A", ["T1", "T2"], weight=weight
+    )
+
+    assert closest == "T2"
+    assert closest_swapped == "T1"
+
+
+def test_nearest_target_map_tie_goes_to_first_listed_target(
+    sdf_graph: SDFTimingGraph,
+) -> None:
+    sdf_graph.graph.add_edge("A", "T1")
+    sdf_graph.graph.add_edge("A", "T2")
+
+    assert sdf_graph.nearest_target_map(["T2", "T1"])["A"] == "T2"
+    assert sdf_graph.nearest_target_map(["T1", "T2"])["A"] == "T1"
+
+
 def test_path_to_nearest_target_sentinel_empty_targets_raises_valueerror(
     sdf_graph: SDFTimingGraph,
 ) -> None:
@@ -544,16 +583,12 @@ def test_path_to_nearest_target_sentinel_empty_targets_raises_valueerror(
         sdf_graph.path_to_nearest_target_sentinel("A", [], weight="weight")
 
 
-def test_path_to_nearest_target_sentinel_custom_prefix_is_cleaned_up(
-    sdf_graph: SDFTimingGraph,
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_path_to_nearest_target_sentinel_missing_source_raises(
+    sdf_graph: SDFTimingGraph, weight: str | None
 ) -> None:
-    path, closest = sdf_graph.path_to_nearest_target_sentinel(
-        "A", ["D"], sentinel_prefix="custom_prefix", weight=None
-    )
-
-    assert path == ["A", "B", "D"]
-    assert closest == "D"
-    assert not any("custom_prefix" in str(node) for node in sdf_graph.graph.nodes)
+    with pytest.raises(nx.NodeNotFound, match="NOT_A_PIN"):
+        sdf_graph.path_to_nearest_target_sentinel("NOT_A_PIN", ["D"], weight=weight)
 
 
 def test_path_to_nearest_target_sentinel_ignores_missing_target_nodes(
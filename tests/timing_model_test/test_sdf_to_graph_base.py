@@ -36,7 +36,6 @@ def make_component(
         to_cell_pin=to_cell_pin,
         delay=delay,
         delay_paths={"fast": {"min": delay, "max": delay}},
-        is_one_cell_instance=(from_cell_instance == to_cell_instance),
         is_timing_check=False,
         is_timing_env=False,
         is_absolute=True,
@@ -145,14 +144,17 @@ def sdf_base(
     sdf_file = tmp_path / "dummy.sdf"
     sdf_file.write_text("dummy sdf file content")
 
-    def fake_gen_timing_digraph(path: Path, delay_type: DelayType) -> SDFGobject:
+    def fake_gen_timing_digraph(
+        path: Path, delay_type: DelayType, *, sdf_text: str | None = None
+    ) -> SDFGobject:
         assert path == sdf_file
         assert delay_type == DelayType.MAX_ALL
+        assert sdf_text == "dummy sdf file content"
         return fake_sdf_graph_object
 
     monkeypatch.setattr(base_mod, "gen_timing_digraph", fake_gen_timing_digraph)
 
-    return SDFTimingGraphBase(sdf_file, DelayType.MAX_ALL)
+    return SDFTimingGraphBase(sdf_file, DelayType.MAX_ALL, keep_raw_sdf=True)
 
 
 def test_init_populates_attributes_from_sdf_object(
@@ -185,6 +187,25 @@ def test_init_detects_input_and_output_ports(sdf_base: SDFTimingGraphBase) -> No
     assert set(sdf_base.output_ports) == {"OUT"}
 
 
+def test_init_releases_raw_sdf_by_default(
+    tmp_path: Path,
+    fake_sdf_graph_object: SDFGobject,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sdf_file = tmp_path / "dummy.sdf"
+    sdf_file.write_text("dummy sdf file content")
+    monkeypatch.setattr(
+        base_mod, "gen_timing_digraph", lambda *_args, **_kwargs: fake_sdf_graph_object
+    )
+
+    sdf_base = SDFTimingGraphBase(sdf_file, DelayType.MAX_ALL)
+
+    assert sdf_base.sdf_file_content is None
+    assert sdf_base.sdf_data_dict is None
+    assert fake_sdf_graph_object.sdf_data is None
+    assert sdf_base.graph is fake_sdf_graph_object.nx_graph
+
+
 def test_get_input_and_output_ports_property(sdf_base: SDFTimingGraphBase) -> None:
     ports = sdf_base.get_input_and_output_ports
     assert set(ports) == {"IN", "OUT"}
@@ -285,6 +306,32 @@ def test_get_cell_instance_component_by_type_can_find_non_iopath_component(
     assert comp.delay == 0.3
 
 
+def test_get_cell_instance_component_by_type_returns_first_duplicate(
+    sdf_base: SDFTimingGraphBase,
+) -> None:
+    first = sdf_base.get_cell_instance_component_by_type(
+        "U1", SDFCellType.IOPATH, "A", "Y"
+    )
+    sdf_base.instances["U1"].append(
+        make_component(
+            c_type=SDFCellType.IOPATH,
+            cell_name="BUF_X1",
+            connection_string="IOPATH A Y",
+            from_cell_instance="U1",
+            to_cell_instance="U1",
+            from_cell_pin="A",
+            to_cell_pin="Y",
+            delay=9.9,
+        )
+    )
+    sdf_base._component_index.clear()  # noqa: SLF001
+
+    assert (
+        sdf_base.get_cell_instance_component_by_type("U1", SDFCellType.IOPATH, "A", "Y")
+        is first
+    )
+
+
 def test_get_cell_instance_component_by_type_missing_instance_raises_keyerror(
     sdf_base: SDFTimingGraphBase,
 ) -> None:
@@ -328,7 +375,9 @@ def test_init_with_graph_having_only_hierarchical_nodes_has_no_top_level_ports(
     sdf_file = tmp_path / "only_hier.sdf"
     sdf_file.write_text("content")
 
-    def fake_gen_timing_digraph(path: Path, delay: DelayType) -> SDFGobject:
+    def fake_gen_timing_digraph(
+        path: Path, delay: DelayType, **_kwargs: object
+    ) -> SDFGobject:
         assert path == sdf_file
         assert delay == DelayType.MAX_ALL
         return sdf_gobject
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 import pytest
@@ -191,6 +192,13 @@ def test_split_instance_pin_without_hierarchy() -> None:
     assert tg.split_instance_pin("CLK", "/") == ("", "CLK")
 
 
+def test_split_instance_pin_interns_names() -> None:
+    inst, pin = tg.split_instance_pin("/".join(["u_core", "CLK_N"]), "/")
+
+    assert inst is sys.intern("u_core")
+    assert pin is sys.intern("CLK_N")
+
+
 def test_parse_sdf_extracts_header_cells_instances_and_components(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1,6 +1,12 @@
+import sys
+from pathlib import Path
+
 import networkx as nx
 import pytest
+from pytest_mock import MockerFixture
 
+from fabulous.fabric_cad.timing_model.hdlnx.hdlnx_timing_model import HdlnxTimingModel
+from fabulous.fabric_cad.timing_model.hdlnx.sdfnx.sdf_to_graph import SDFTimingGraph
 from fabulous.fabric_cad.timing_model.hdlnx.verilog_gate_level import (
     VerilogGateLevelTimingGraph,
 )
@@ -38,6 +44,7 @@ def vg() -> VerilogGateLevelTimingGraph:
     obj.top_name = "Top"
     obj.hier_sep = "/"
     obj.verilog_netlist_content = TEST_NETLIST
+    obj._resolved_pin_cache = {}  # noqa: SLF001
     obj.graph = nx.DiGraph()
     obj.reverse_graph = nx.DiGraph()
     obj.input_ports = {"IN1", "IN2"}
@@ -69,6 +76,32 @@ def test_find_verilog_modules_regex_no_match(
     assert vg.find_verilog_modules_regex(r"^XYZ$") == []
 
 
+def test_find_verilog_modules_regex_block_opener_in_line_comment(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    vg.verilog_netlist_content = (
+        "module A (X); // see /* below\nendmodule\nmodule B (Y); /* real */ endmodule\n"
+    )
+
+    assert vg.find_verilog_modules_regex(r".*") == ["A", "B"]
+
+
+def test_module_body_is_not_cut_at_identifier_containing_endmodule(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    vg.verilog_netlist_content = (
+        "module Top (A, Y);\n"
+        "    BUF u_a ( .A(A), .Y(endmodule_n) );\n"
+        "    BUF u_b ( .A(endmodule_n), .Y(Y) );\n"
+        "endmodule\n"
+    )
+
+    assert vg.get_module_instance_nets("Top") == {
+        "u_a": ["A", "endmodule_n"],
+        "u_b": ["endmodule_n", "Y"],
+    }
+
+
 def test_find_instance_paths_by_regex_matches_recursive_paths(
     vg: VerilogGateLevelTimingGraph,
 ) -> None:
@@ -119,6 +152,18 @@ def test_find_instances_paths_with_all_nets(
     assert vg.find_instances_paths_with_all_nets("Top", ["n_mid", "OUT1"]) == ["u_buf0"]
 
 
+def test_find_instances_paths_with_all_nets_in_submodule(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    assert vg.find_instances_paths_with_all_nets("LeafWrap", ["IN", "OUT"]) == [
+        "u_mid/u_leaf1/leafbuf",
+        "u_leaf2/leafbuf",
+    ]
+    assert vg.find_instances_paths_with_all_nets(
+        "LeafWrap", ["IN", "OUT"], filter_regex=r"^u_mid"
+    ) == ["u_mid/u_leaf1/leafbuf"]
+
+
 def test_net_to_pin_paths_for_instance_leaf(
     vg: VerilogGateLevelTimingGraph,
 ) -> None:
@@ -138,6 +183,26 @@ def test_net_to_pin_paths_for_instance_nested(
     }
 
 
+def test_net_to_pin_paths_for_instance_missing_instance(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    with pytest.raises(
+        ValueError, match=r"Instance 'nope' not found inside module 'Mid'"
+    ):
+        vg.net_to_pin_paths_for_instance("u_mid/nope")
+
+
+def test_hierarchy_queries_parse_netlist_once(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    vg.find_instance_paths_by_regex(r"u_buf0$")
+    # Later queries must reuse the parsed modules instead of the raw text
+    vg.verilog_netlist_content = ""
+
+    assert vg.get_instance_pins("u_mid/u_nand1") == ["A", "B", "Y"]
+    assert vg.resolve_hier_pin("u_mid/A") == ["u_mid/u_leaf1/leafbuf/A"]
+
+
 def test_resolve_hier_pin_leaf_std_cell_returns_same_leaf(
     vg: VerilogGateLevelTimingGraph,
 ) -> None:
@@ -156,6 +221,16 @@ def test_resolve_hier_pin_nested_submodule(
     assert vg.resolve_hier_pin("u_mid/u_leaf1/IN") == ["u_mid/u_leaf1/leafbuf/A"]
 
 
+def test_resolve_hier_pin_returns_copies_of_cached_result(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    first = vg.resolve_hier_pin("u_mid/A")
+    first.append("junk")
+
+    assert vg.resolve_hier_pin("u_mid/A") == ["u_mid/u_leaf1/leafbuf/A"]
+    assert vg._resolved_pin_cache == {"u_mid/A": ["u_mid/u_leaf1/leafbuf/A"]}  # noqa: SLF001
+
+
 def test_resolve_hier_pin_missing_target_pin(
     vg: VerilogGateLevelTimingGraph,
 ) -> None:
@@ -244,40 +319,56 @@ def test_nearest_port_from_pin_rejects_invalid_num_ports(
 
 def test_nearest_port_from_pin_single_port(
     vg: VerilogGateLevelTimingGraph,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    def _path_to_nearest_target_sentinel(
-        _pin: str, _targets: set[str], reverse: bool = False
-    ) -> tuple[list[str], str]:
-        _ = reverse
-        return ["dummy"], "OUT1"
-
-    monkeypatch.setattr(
-        vg,
-        "path_to_nearest_target_sentinel",
-        _path_to_nearest_target_sentinel,
+    vg.graph.add_edges_from(
+        [("IN1", "u_buf0/A"), ("u_buf0/A", "N1"), ("N1", "OUT1"), ("N1", "N2")]
     )
+    vg.graph.add_edge("N2", "OUT2")
+    vg.reverse_graph = vg.graph.reverse(copy=False)
+
     assert vg.nearest_port_from_pin("u_buf0/A", reverse=False, num_ports=1) == ["OUT1"]
+    assert vg.nearest_port_from_pin("u_buf0/A", reverse=True, num_ports=1) == ["IN1"]
 
 
 def test_nearest_port_from_pin_single_port_none(
     vg: VerilogGateLevelTimingGraph,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    def _path_to_nearest_target_sentinel(
-        _pin: str, _targets: set[str], reverse: bool = False
-    ) -> tuple[list[str], None]:
-        _ = reverse
-        return [], None
+    vg.graph.add_edge("u_buf0/A", "N1")
+    vg.reverse_graph = vg.graph.reverse(copy=False)
 
-    monkeypatch.setattr(
-        vg,
-        "path_to_nearest_target_sentinel",
-        _path_to_nearest_target_sentinel,
-    )
     assert vg.nearest_port_from_pin("u_buf0/A", num_ports=1) == []
 
 
+@pytest.mark.parametrize("num_ports", [1, 2])
+def test_nearest_port_from_pin_missing_pin_raises(
+    vg: VerilogGateLevelTimingGraph, num_ports: int
+) -> None:
+    vg.graph.add_edge("u_buf0/A", "OUT1")
+
+    with pytest.raises(nx.NodeNotFound, match="MISSING"):
+        vg.nearest_port_from_pin("MISSING", num_ports=num_ports)
+
+
+def test_nearest_port_from_pin_single_port_matches_sentinel_search(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    vg.graph = nx.gnp_random_graph(60, 0.05, seed=3, directed=True)
+    vg.graph = nx.relabel_nodes(vg.graph, str)
+    vg.reverse_graph = vg.graph.reverse(copy=False)
+    vg.input_ports = ["0", "7", "21"]
+    vg.output_ports = ["3", "40", "59"]
+
+    for pin in vg.graph:
+        for reverse in (False, True):
+            ports = vg.input_ports if reverse else vg.output_ports
+            _, expected = vg.path_to_nearest_target_sentinel(
+                pin, ports, reverse=reverse
+            )
+            assert vg.nearest_port_from_pin(pin, reverse=reverse) == (
+                [expected] if expected is not None else []
+            )
+
+
 def test_nearest_port_from_pin_multiple_forward(
     vg: VerilogGateLevelTimingGraph,
 ) -> None:
@@ -356,3 +447,45 @@ def test_nearest_ports_from_instance_pin_nets(
         "N2": ["OUT2"],
     }
     assert flat == ["OUT1", "OUT2"]
+
+
+def test_init_cleans_up_sdf_when_parsing_fails(mocker: MockerFixture) -> None:
+    sta_tool = mocker.Mock()
+    mocker.patch.object(SDFTimingGraph, "__init__", side_effect=RuntimeError("bad sdf"))
+
+    with pytest.raises(RuntimeError, match="bad sdf"):
+        VerilogGateLevelTimingGraph(top_name="Top", sta_tool=sta_tool)
+    sta_tool.sta_clean_up.assert_called_once_with()
+
+
+def test_resolve_hier_pin_handles_hierarchy_deeper_than_recursion_limit(
+    vg: VerilogGateLevelTimingGraph,
+) -> None:
+    depth = sys.getrecursionlimit() + 100
+    chain = "\n".join(
+        f"module W{i} (A); W{i + 1} u ( .A(A) ); endmodule" for i in range(depth)
+    )
+    vg.verilog_netlist_content = (
+        f"{chain}\nmodule W{depth} (A); BUF b ( .A(A) ); endmodule\n"
+        "module Top (IN1); W0 u_w ( .A(IN1) ); endmodule\n"
+    )
+
+    leaf = vg.resolve_hier_pin("u_w/A")
+
+    assert leaf == ["u_w/" + "u/" * depth + "b/A"]
+    assert len(vg.find_instance_paths_by_regex(r"/b$")) == 1
+
+
+def test_hdlnx_init_parses_netlist_alongside_sta(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    netlist = tmp_path / "top.v"
+    netlist.write_text(TEST_NETLIST)
+    synth_tool = mocker.Mock(synth_netlist_file=netlist, synth_design_name="Top")
+    mocker.patch.object(VerilogGateLevelTimingGraph, "__init__", return_value=None)
+
+    model = HdlnxTimingModel(sta_tool=mocker.Mock(), synth_tool=synth_tool)
+
+    assert "_netlist_net_fanout" in vars(model)
+    assert model.get_raw_verilog_netlist_data() == TEST_NETLIST
+    synth_tool.synth_clean_up.assert_called_once_with()
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from fabulous.fabric_cad.timing_model.tools.synth_tools.yosys import YosysTool
+
+
+def _written_file(script: str, command: str) -> Path:
+    line = next(line for line in script.splitlines() if line.startswith(command))
+    return Path(line.split()[-1])
+
+
+@pytest.fixture
+def yosys_tool(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> YosysTool:
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    rtl = tmp_path / "top.v"
+    rtl.write_text("module top(); endmodule\n")
+    lib = tmp_path / "cells.lib"
+    lib.write_text("library(cells) {}\n")
+
+    tool = YosysTool(
+        synth_executable="yosys", top_name="top", verilog_files=[rtl], liberty_files=lib
+    )
+    mocker.patch.object(tool, "_check_errors")
+
+    def fake_yosys(*_args: object, stdin_data: str, **_kwargs: object) -> None:
+        _written_file(stdin_data, "write_verilog").write_text(
+            "module top(); wire [0:0] w; endmodule\n"
+        )
+
+    mocker.patch.object(tool, "_call_external", side_effect=fake_yosys)
+    return tool
+
+
+def test_synthesize_strips_single_bit_ranges(yosys_tool: YosysTool) -> None:
+    yosys_tool.synth_synthesize()
+
+    assert "[0:0]" not in yosys_tool.synth_netlist_file.read_text()
+
+
+def test_synthesize_writes_a_unique_netlist_per_run(yosys_tool: YosysTool) -> None:
+    yosys_tool.synth_synthesize()
+    first = yosys_tool.synth_netlist_file
+
+    yosys_tool.synth_synthesize()
+
+    assert yosys_tool.synth_netlist_file != first
+    assert first.parent == Path.home() / ".fabulous" / "tmp"
+    assert first.name.startswith("synth_top_")
+
+
+def test_synthesize_rejects_empty_netlist(yosys_tool: YosysTool) -> None:
+    def empty_yosys(*_args: object, stdin_data: str, **_kwargs: object) -> None:
+        _written_file(stdin_data, "write_verilog").write_text("")
+
+    yosys_tool._call_external.side_effect = empty_yosys  # noqa: SLF001
+
+    with pytest.raises(RuntimeError, match="No content"):
+        yosys_tool.synth_synthesize()
+    assert not list((Path.home() / ".fabulous" / "tmp").iterdir())
+
+
+def test_synthesize_removes_netlist_when_yosys_fails(yosys_tool: YosysTool) -> None:
+    yosys_tool._call_external.side_effect = RuntimeError("yosys failed")  # noqa: SLF001
+
+    with pytest.raises(RuntimeError, match="yosys failed"):
+        yosys_tool.synth_synthesize()
+    assert not list((Path.home() / ".fabulous" / "tmp").iterdir())
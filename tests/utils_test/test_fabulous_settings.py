@@ -137,6 +137,20 @@ class TestFABulousSettings:
         with pytest.raises(ValidationError):
             init_context(project)
 
+    def test_settings_are_frozen(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Settings cannot be mutated once built; updates go through a copy."""
+        monkeypatch.setenv("PATH", "/bin:/usr/bin")
+        mocker.patch("fabulous.fabulous_settings.which", return_value=None)
+
+        settings = init_context(project)
+
+        with pytest.raises(ValidationError):
+            settings.debug = True
+        assert settings.model_copy(update={"debug": True}).debug is True
+        assert settings.debug is False
+
     def test_initialization_with_tool_paths_found(
         self, project: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
     ) -> None: